@@ -0,0 +1,80 @@
+"""
+Keep-alive HTTP GETs shared by the observer bridges.
+
+Each thread keeps one connection per host, so repeated pulls from the same
+API pay for one TLS handshake instead of one per request. Errors mirror
+urlopen: HTTPError for 4xx/5xx, URLError when the request can't be made.
+When a proxy is configured for the scheme (HTTP(S)_PROXY), the request goes
+through urlopen instead so the proxy is honoured. Stdlib only.
+"""
+
+import http.client
+import threading
+from urllib.error import HTTPError, URLError
+from urllib.parse import urljoin, urlsplit
+from urllib.request import Request, getproxies, urlopen
+
+# (thread, scheme, netloc) -> connection; closed by close_connections
+_CONNECTIONS: dict[tuple[int, str, str], http.client.HTTPConnection] = {}
+_REDIRECTS = (301, 302, 303, 307, 308)
+MAX_REDIRECTS = 10  # urllib's limit
+
+
+def http_get(url: str, headers: dict, timeout: float) -> tuple[int, http.client.HTTPMessage, bytes]:
+    """GET url, following redirects. Returns (status, headers, body).
+
+    2xx and 304 Not Modified are returned; 4xx/5xx raise HTTPError, as does
+    running out of redirects. A reused socket the server has since dropped
+    is retried once on a fresh connection.
+    """
+    for _ in range(MAX_REDIRECTS):
+        parts = urlsplit(url)
+        if parts.scheme in getproxies():
+            try:
+                with urlopen(Request(url, headers=headers), timeout=timeout) as resp:
+                    return resp.status, resp.headers, resp.read()
+            except HTTPError as e:
+                if e.code == 304:
+                    return 304, e.headers, b""
+                raise
+
+        key = (threading.get_ident(), parts.scheme, parts.netloc)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+        while True:
+            conn = _CONNECTIONS.get(key)
+            reused = conn is not None and conn.sock is not None
+            if conn is None:
+                cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+                conn = _CONNECTIONS[key] = cls(parts.netloc, timeout=timeout)
+            elif conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            conn.timeout = timeout
+            try:
+                conn.request("GET", path, headers=headers)
+                resp = conn.getresponse()
+                body = resp.read()
+                break
+            except (http.client.HTTPException, OSError) as e:
+                conn.close()
+                # The server may drop an idle kept-alive socket; retry once fresh
+                if reused and not isinstance(e, TimeoutError):
+                    continue
+                raise URLError(e)
+
+        location = resp.getheader("Location")
+        if resp.status in _REDIRECTS and location:
+            url = urljoin(url, location)
+            continue
+        if resp.status >= 400:
+            raise HTTPError(url, resp.status, resp.reason, resp.headers, None)
+        return resp.status, resp.headers, body
+    raise HTTPError(url, resp.status, "redirect loop", resp.headers, None)
+
+
+def close_connections():
+    """Close every kept-alive connection. Call once no request is in flight."""
+    for conn in _CONNECTIONS.values():
+        conn.close()
+    _CONNECTIONS.clear()
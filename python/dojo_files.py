@@ -0,0 +1,37 @@
+"""
+Directory listing and small-file writes shared by the dojo converters.
+
+The converters touch thousands of one-scenario files per run, so these skip
+the per-file Path objects and buffered-io layers pathlib would add. Stdlib only.
+"""
+
+import os
+from pathlib import Path
+
+
+def list_files(directory: Path, prefix: str, suffix: str) -> list[str]:
+    """Sorted paths of the files in ``directory`` named prefix*suffix.
+    Plain strings from one scandir — globbing builds and sorts a Path per file."""
+    try:
+        with os.scandir(directory) as it:
+            return sorted(e.path for e in it if e.name.startswith(prefix) and e.name.endswith(suffix))
+    except FileNotFoundError:
+        return []
+
+
+def count_files(directory: Path, suffix: str) -> int:
+    """Number of entries in ``directory`` named *suffix, without building a Path for each."""
+    with os.scandir(directory) as it:
+        return sum(1 for e in it if e.name.endswith(suffix))
+
+
+def write_file(path: str, data: bytes):
+    """Create or replace a small file with one unbuffered write.
+    Skips the buffered-io layers Path.write_bytes stacks on every scenario file."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
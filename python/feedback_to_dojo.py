@@ -14,29 +14,194 @@ Output uses the same scenario schema as world_data_to_dojo.py, compatible
 with ThreatSimulator.loadMoltbookScenarios().
 
 Usage:
-    python3 feedback_to_dojo.py [path_to_feedback_export.json]
+    python3 feedback_to_dojo.py [--jsonl | --arrow] [path_to_feedback_export.json]
 
 If no path given, reads from ~/.config/observer/raw/feedback_*.json
+
+--jsonl appends every scenario to a single scenarios.jsonl instead of
+writing one fb_*.json per scenario. --arrow writes a flattened, columnar
+Arrow IPC file (scenarios_<ts>.arrow) per run. loadMoltbookScenarios()
+only reads *.json files, so keep the default layout for the Swift dojo.
 """
 
+import functools
 import json
+import mmap
+import os
+import re
 import sys
+import time
 import uuid
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
+from itertools import chain, islice
 from pathlib import Path
 
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback — same output, just slower
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:  # NumPy mask path is used instead of the compiled kernel
+    njit = None
+
 # ==================== PATHS ====================
 RAW_DIR = Path.home() / ".config" / "observer" / "raw"
 FINANCIAL_DOJO_DIR = Path.home() / ".config" / "observer" / "scenarios" / "financial_dojo"
 FINANCIAL_DOJO_DIR.mkdir(parents=True, exist_ok=True)
 
+_NON_SPACE = re.compile(rb"\S")
+# Where one record of an export array may end and the next begin. A match can
+# also fall inside a record (an array of objects, or a string), which the
+# slice's parse catches.
+_RECORD_SEP = re.compile(rb"\}[ \t\n\r]*,[ \t\n\r]*\{")
+_JSON_SPACE = re.compile(rb"[ \t\n\r]*")
+# Separators one record may swallow before the array is parsed whole instead
+MAX_RECORD_MERGES = 32
+
 
 def _log(*args):
     print(f"[{datetime.now(timezone.utc).isoformat()}]", *args, flush=True)
 
 
-def classify_feedback(record: dict) -> dict:
-    """Classify a single feedback record into a training scenario."""
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _dataclass_fields(obj) -> dict:
+    """json ``default`` hook: shallow field dict, nested dataclasses recurse via json."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=_dataclass_fields).encode()
+
+
+def _json_dumps_line(obj) -> bytes:
+    """Serialize to one compact, newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(",", ":"), default=_dataclass_fields).encode() + b"\n"
+
+
+# (scenarioType, isThreat, correctDecision, difficulty), indexed by the
+# classification code computed in classify_batch:
+#   0 — user saw warnings but proceeded; Guardian may have been too aggressive
+#   1 — high suspicion but no alerts fired; Guardian may have missed something
+#   2 — alerts fired and user did NOT override; Guardian correctly flagged
+#   3 — clean transaction, no warnings, no alerts; benign baseline
+SCENARIO_CLASSES = (
+    ("falsePositiveCandidate", False, "ALLOW", "hard"),
+    ("falseNegativeCandidate", True, "ALERT", "hard"),
+    ("truePositive", True, "ALERT", "medium"),
+    ("benignBaseline", False, "ALLOW", "easy"),
+)
+
+BATCH_SIZE = 10_000
+JSONL_FILENAME = "scenarios.jsonl"
+OUTPUT_FORMATS = ("json", "jsonl", "arrow")
+# Scenario files are independent paths, so writes fan out across threads
+WRITE_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+
+# ==================== SCENARIO SCHEMA ====================
+# Slotted records mirroring the scenario JSON. Field names are the JSON keys
+# (camelCase) and field order is the key order, so orjson and the stdlib
+# fallback both serialize them exactly like the equivalent dicts.
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class SenderInfo:
+    displayName: str = "Wallet User"
+    accountAge: str = "unknown"
+    mutualConnections: int = 0
+    isVerified: bool = True
+    riskIndicators: list[str]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class GroundTruth:
+    isThreat: bool
+    correctDecision: str
+    threatCategory: str
+    severity: float
+    patterns: list[str]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TransactionContext:
+    chain: str
+    amountUSD: float
+    txHash: str
+    suspicionLevel: float
+    autoSign: bool
+    alertCount: int
+    warningCount: int
+    userOverrode: bool
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Context:
+    scenarioType: str
+    profileType: str = "wallet_user"
+    platform: str = "FreedomWallet"
+    threatContent: str
+    senderInfo: SenderInfo
+    groundTruth: GroundTruth
+    policyRules: list[str] = field(default_factory=list)
+    transactionContext: TransactionContext
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ScenarioMetadata:
+    source: str = "production_feedback"
+    chain: str
+    amountUSD: float
+    convertedAt: str
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class Scenario:
+    source: str = "production_feedback"
+    id: str
+    context: Context
+    conversationHistory: list[str]
+    difficulty: str
+    metadata: ScenarioMetadata
+
+
+@functools.lru_cache(maxsize=65536)
+def _alert_fragments(alerts: tuple, auto_sign: bool, value_tier: int) -> tuple[tuple, str]:
+    """Return (risk indicators, alerts summary) for one alert/value combination.
+
+    Exports repeat a handful of alert combinations, so these are built once
+    per distinct key and reused across records.
+    """
+    risk_indicators = list(alerts)
+    if auto_sign:
+        risk_indicators.append("auto_sign_used")
+    if value_tier >= 2:
+        risk_indicators.append("high_value_tx")
+    if value_tier >= 1:
+        risk_indicators.append("medium_value_tx")
+    return tuple(risk_indicators), ", ".join(alerts) if alerts else "none"
+
+
+def _build_scenario(record: dict, code: int, severity: float, converted_at: str) -> Scenario:
+    """Assemble the scenario for one record from its precomputed class."""
+    scenario_type, is_threat, correct_decision, difficulty = SCENARIO_CLASSES[code]
     overrode = record.get("userOverrodeWarning", False)
     suspicion = record.get("suspicionLevel", 0.0)
     alerts = record.get("alertsTriggered", [])
@@ -46,111 +211,194 @@ def classify_feedback(record: dict) -> dict:
     chain = record.get("chain", "unknown")
     tx_hash = record.get("txHash", "")
 
-    # Classification logic
-    if overrode:
-        # User saw warnings but proceeded — Guardian may have been too aggressive
-        scenario_type = "falsePositiveCandidate"
-        is_threat = False
-        correct_decision = "ALLOW"
-        severity = round(min(suspicion, 0.4), 3)
-        difficulty = "hard"
-    elif suspicion > 0.5 and not alerts:
-        # High suspicion but no alerts fired — Guardian may have missed something
-        scenario_type = "falseNegativeCandidate"
-        is_threat = True
-        correct_decision = "ALERT"
-        severity = round(suspicion, 3)
-        difficulty = "hard"
-    elif alerts:
-        # Alerts fired and user did NOT override — Guardian correctly flagged
-        scenario_type = "truePositive"
-        is_threat = True
-        correct_decision = "ALERT"
-        severity = round(min(0.5 + suspicion * 0.3, 0.9), 3)
-        difficulty = "medium"
-    else:
-        # Clean transaction, no warnings, no alerts — benign baseline
-        scenario_type = "benignBaseline"
-        is_threat = False
-        correct_decision = "ALLOW"
-        severity = 0.0
-        difficulty = "easy"
-
     # Build risk indicators from context
-    risk_indicators = list(alerts)
-    if auto_sign:
-        risk_indicators.append("auto_sign_used")
-    if amount_usd > 5000:
-        risk_indicators.append("high_value_tx")
-    if amount_usd > 1000:
-        risk_indicators.append("medium_value_tx")
+    value_tier = 2 if amount_usd > 5000 else 1 if amount_usd > 1000 else 0
+    risk_indicators, alerts_text = _alert_fragments(tuple(alerts), bool(auto_sign), value_tier)
+
+    # The record's alerts list is reused as-is when there is nothing to append
+    patterns = alerts + [w[:80] for w in warnings[:3]] if warnings else alerts
 
-    # Build threat content summary
+    # Build threat content summary in one join of pre-formatted fragments
     warning_text = "; ".join(warnings) if warnings else "No warnings"
-    threat_content = (
-        f"Transaction on {chain}: ${amount_usd:.2f} USD. "
-        f"Suspicion level: {suspicion:.2f}. "
-        f"Alerts: {', '.join(alerts) if alerts else 'none'}. "
-        f"Warnings shown: {warning_text}. "
-        f"User overrode: {overrode}. Auto-sign: {auto_sign}."
+    threat_content = "".join((
+        "Transaction on ", str(chain), ": $", format(amount_usd, ".2f"), " USD. ",
+        "Suspicion level: ", format(suspicion, ".2f"), ". ",
+        "Alerts: ", alerts_text, ". ",
+        "Warnings shown: ", warning_text, ". ",
+        "User overrode: ", str(overrode), ". Auto-sign: ", str(auto_sign), ".",
+    ))
+
+    return Scenario(
+        id=uuid.uuid4().hex,
+        context=Context(
+            scenarioType=scenario_type,
+            threatContent=threat_content,
+            senderInfo=SenderInfo(riskIndicators=list(risk_indicators)),
+            groundTruth=GroundTruth(
+                isThreat=is_threat,
+                correctDecision=correct_decision,
+                threatCategory=scenario_type,
+                severity=severity,
+                patterns=patterns,
+            ),
+            transactionContext=TransactionContext(
+                chain=chain,
+                amountUSD=amount_usd,
+                txHash=tx_hash,
+                suspicionLevel=suspicion,
+                autoSign=auto_sign,
+                alertCount=len(alerts),
+                warningCount=len(warnings),
+                userOverrode=overrode,
+            ),
+        ),
+        conversationHistory=[threat_content],
+        difficulty=difficulty,
+        metadata=ScenarioMetadata(chain=chain, amountUSD=amount_usd, convertedAt=converted_at),
     )
 
-    return {
-        "source": "production_feedback",
-        "id": str(uuid.uuid4()),
-        "context": {
-            "scenarioType": scenario_type,
-            "profileType": "wallet_user",
-            "platform": "FreedomWallet",
-            "threatContent": threat_content,
-            "senderInfo": {
-                "displayName": "Wallet User",
-                "accountAge": "unknown",
-                "mutualConnections": 0,
-                "isVerified": True,
-                "riskIndicators": risk_indicators,
-            },
-            "groundTruth": {
-                "isThreat": is_threat,
-                "correctDecision": correct_decision,
-                "threatCategory": scenario_type,
-                "severity": severity,
-                "patterns": alerts + [w[:80] for w in warnings[:3]],
-            },
-            "policyRules": [],
-            "transactionContext": {
-                "chain": chain,
-                "amountUSD": amount_usd,
-                "txHash": tx_hash,
-                "suspicionLevel": suspicion,
-                "autoSign": auto_sign,
-                "alertCount": len(alerts),
-                "warningCount": len(warnings),
-                "userOverrode": overrode,
-            },
-        },
-        "conversationHistory": [threat_content],
-        "difficulty": difficulty,
-        "metadata": {
-            "source": "production_feedback",
-            "chain": chain,
-            "amountUSD": amount_usd,
-            "convertedAt": datetime.now(timezone.utc).isoformat(),
-        },
-    }
 
+def _classify_codes_numpy(overrode, suspicion, n_alerts):
+    """Return (class codes, unrounded severity) using NumPy masks."""
+    # Nested np.where mirrors the if/elif order: override wins, then a missed
+    # high-suspicion tx, then fired alerts, else benign
+    m_fn = (suspicion > 0.5) & (n_alerts == 0)
+    m_tp = n_alerts > 0
+    codes = np.where(overrode, 0, np.where(m_fn, 1, np.where(m_tp, 2, 3))).astype(np.int8)
+    severity = np.where(
+        overrode,
+        np.minimum(suspicion, 0.4),
+        np.where(m_fn, suspicion, np.where(m_tp, np.minimum(0.5 + 0.3 * suspicion, 0.9), 0.0)),
+    )
+    return codes, severity
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def _classify_codes(overrode, suspicion, n_alerts):
+        """Return (class codes, unrounded severity) in a single compiled pass."""
+        n = suspicion.shape[0]
+        codes = np.empty(n, dtype=np.int8)
+        severity = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            s = suspicion[i]
+            if overrode[i]:
+                codes[i] = 0
+                severity[i] = min(s, 0.4)
+            elif s > 0.5 and n_alerts[i] == 0:
+                codes[i] = 1
+                severity[i] = s
+            elif n_alerts[i] > 0:
+                codes[i] = 2
+                severity[i] = min(0.5 + s * 0.3, 0.9)
+            else:
+                codes[i] = 3
+                severity[i] = 0.0
+        return codes, severity
+
+else:
+    _classify_codes = _classify_codes_numpy
+
+
+def classify_batch(records: list[dict]) -> list[Scenario]:
+    """Classify a batch of feedback records into training scenarios.
 
-def load_feedback(path: str | None = None) -> list[dict]:
-    """Load feedback records from a file or glob the raw directory."""
+    The classification cascade and severity run over pre-unpacked arrays
+    (Numba-compiled when available, NumPy masks otherwise); only the final
+    dict assembly walks the records.
+    """
+    n = len(records)
+    overrode = np.fromiter(
+        (bool(r.get("userOverrodeWarning", False)) for r in records), dtype=bool, count=n
+    )
+    suspicion = np.fromiter(
+        (r.get("suspicionLevel", 0.0) for r in records), dtype=np.float64, count=n
+    )
+    n_alerts = np.fromiter(
+        (len(r.get("alertsTriggered", [])) for r in records), dtype=np.int64, count=n
+    )
+    codes, severity = _classify_codes(overrode, suspicion, n_alerts)
+    converted_at = datetime.now(timezone.utc).isoformat()
+
+    # Python's round() keeps the exact rounding of the scalar implementation
+    # (np.round scales by 10**3 first and can land on the other side of .5)
+    return [
+        _build_scenario(record, code, round(sev, 3), converted_at)
+        for record, code, sev in zip(records, codes.tolist(), severity.tolist())
+    ]
+
+
+def classify_feedback(record: dict) -> Scenario:
+    """Classify a single feedback record into a training scenario."""
+    return classify_batch([record])[0]
+
+
+def _iter_array(buf, pos: int) -> Iterator[dict]:
+    """Yield the objects of a top-level JSON array held in ``buf``.
+
+    The array is split at ``},{`` and each slice decoded once, as it is
+    consumed, so the array itself is never materialized. A slice that doesn't
+    parse is extended to the next separator (it ended inside a record); if
+    that keeps failing the buffer is parsed whole, which raises the real
+    syntax error or yields what json.load would past the records already
+    yielded. Records before a syntax error are still yielded.
+    """
+    end = buf.rfind(b"]")
+    count = 0
+    if end > pos and _JSON_SPACE.fullmatch(buf, end + 1, len(buf)):
+        seps = _RECORD_SEP.finditer(buf, pos + 1, end)
+        start = pos + 1
+        merges = 0
+        while True:
+            m = next(seps, None)
+            stop = m.start() + 1 if m else end
+            try:
+                record = _json_loads(buf[start:stop])
+            except ValueError:
+                if m is None or merges == MAX_RECORD_MERGES:
+                    break
+                merges += 1
+                continue
+            yield record
+            count += 1
+            if m is None:
+                return
+            start = m.end() - 1
+            merges = 0
+        # The scanner pins the buffer; a traceback through this frame would
+        # keep it alive and stop the caller's mmap from closing
+        del seps
+    yield from islice(_json_loads(buf[:]), count, None)
+
+
+def _iter_file(p: Path) -> Iterator[dict]:
+    """Yield records from one export, slicing arrays out of a read-only mmap."""
+    with open(p, "rb") as fh:
+        if p.stat().st_size == 0:
+            raise json.JSONDecodeError("Empty feedback file", "", 0)
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            first = _NON_SPACE.search(mm)
+            if first and first.group() == b"[":
+                yield from _iter_array(mm, first.start())
+                return
+            data = _json_loads(mm[:])
+    # Handle both single-record and array exports
+    if isinstance(data, list):
+        yield from data
+    else:
+        yield data
+
+
+def iter_feedback(path: str | None = None) -> Iterator[dict]:
+    """Yield feedback records from a file or the raw directory, one at a time."""
     if path:
         p = Path(path)
         if not p.exists():
             _log(f"ERROR: File not found: {path}")
-            return []
-        with open(p) as f:
-            data = json.load(f)
-        # Handle both single-record and array exports
-        return data if isinstance(data, list) else [data]
+            return
+        yield from _iter_file(p)
+        return
 
     # Glob for feedback files in raw directory
     files = sorted(RAW_DIR.glob("feedback_*.json"))
@@ -159,68 +407,207 @@ def load_feedback(path: str | None = None) -> list[dict]:
         files = sorted(RAW_DIR.glob("guardian_feedback_export_*.json"))
     if not files:
         _log("No feedback files found in", RAW_DIR)
-        return []
+        return
 
-    records = []
     for f in files:
         try:
-            with open(f) as fh:
-                data = json.load(fh)
-            if isinstance(data, list):
-                records.extend(data)
-            else:
-                records.append(data)
+            yield from _iter_file(f)
         except (json.JSONDecodeError, OSError) as e:
             _log(f"Skipping {f.name}: {e}")
-    return records
 
 
-def convert_and_save(records: list[dict]) -> dict:
-    """Convert feedback records to scenarios and save to financial dojo dir."""
+def _write_scenario(scenario: Scenario) -> None:
+    """Write one scenario file into the financial dojo dir."""
+    filename = f"fb_{scenario.id[:8]}.json"
+    (FINANCIAL_DOJO_DIR / filename).write_bytes(_json_dumps(scenario))
+
+
+def _tally(stats: dict, scenario: Scenario) -> None:
+    """Count a converted scenario into the run stats."""
+    stats["total"] += 1
+
+    st = scenario.context.scenarioType
+    if st == "falsePositiveCandidate":
+        stats["falsePositive"] += 1
+    elif st == "falseNegativeCandidate":
+        stats["falseNegative"] += 1
+    elif st == "truePositive":
+        stats["truePositive"] += 1
+    else:
+        stats["benign"] += 1
+
+
+def _flatten_scenario(scenario: Scenario) -> dict:
+    """Flatten a scenario into one Arrow row.
+
+    conversationHistory ([threatContent]), policyRules ([]) and the metadata
+    block duplicate other columns and are rebuilt at read time if needed.
+    """
+    ctx = scenario.context
+    sender = ctx.senderInfo
+    truth = ctx.groundTruth
+    tx = ctx.transactionContext
+    return {
+        "id": scenario.id,
+        "source": scenario.source,
+        "scenarioType": ctx.scenarioType,
+        "profileType": ctx.profileType,
+        "platform": ctx.platform,
+        "threatContent": ctx.threatContent,
+        "senderDisplayName": sender.displayName,
+        "senderAccountAge": sender.accountAge,
+        "senderMutualConnections": sender.mutualConnections,
+        "senderIsVerified": sender.isVerified,
+        "riskIndicators": sender.riskIndicators,
+        "isThreat": truth.isThreat,
+        "correctDecision": truth.correctDecision,
+        "threatCategory": truth.threatCategory,
+        "severity": truth.severity,
+        "patterns": truth.patterns,
+        "chain": tx.chain,
+        "amountUSD": tx.amountUSD,
+        "txHash": tx.txHash,
+        "suspicionLevel": tx.suspicionLevel,
+        "autoSign": tx.autoSign,
+        "alertCount": tx.alertCount,
+        "warningCount": tx.warningCount,
+        "userOverrode": tx.userOverrode,
+        "difficulty": scenario.difficulty,
+        "convertedAt": scenario.metadata.convertedAt,
+    }
+
+
+def _arrow_schema(pa):
+    """Column layout for --arrow output; low-cardinality strings are dictionary-encoded."""
+    category = pa.dictionary(pa.int32(), pa.string())
+    return pa.schema([
+        ("id", pa.string()),
+        ("source", category),
+        ("scenarioType", category),
+        ("profileType", category),
+        ("platform", category),
+        ("threatContent", pa.string()),
+        ("senderDisplayName", category),
+        ("senderAccountAge", category),
+        ("senderMutualConnections", pa.int64()),
+        ("senderIsVerified", pa.bool_()),
+        ("riskIndicators", pa.list_(pa.string())),
+        ("isThreat", pa.bool_()),
+        ("correctDecision", category),
+        ("threatCategory", category),
+        ("severity", pa.float64()),
+        ("patterns", pa.list_(pa.string())),
+        ("chain", category),
+        ("amountUSD", pa.float64()),
+        ("txHash", pa.string()),
+        ("suspicionLevel", pa.float64()),
+        ("autoSign", pa.bool_()),
+        ("alertCount", pa.int64()),
+        ("warningCount", pa.int64()),
+        ("userOverrode", pa.bool_()),
+        ("difficulty", category),
+        ("convertedAt", category),
+    ])
+
+
+def _save_arrow(batches: Iterator[list[Scenario]], stats: dict) -> Path | None:
+    """Write every batch of scenarios as one RecordBatch of an Arrow IPC file.
+
+    The file is built under a .tmp name and only moved into place once it is
+    complete. Returns its path, or None when there were no scenarios to write.
+    """
+    first = next(batches, None)
+    if not first:
+        return None
+
+    import pyarrow as pa
+
+    schema = _arrow_schema(pa)
+    out_path = FINANCIAL_DOJO_DIR / f"scenarios_{time.time_ns()}.arrow"
+    tmp = out_path.with_suffix(".arrow.tmp")
+    try:
+        with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+            for scenarios in chain((first,), batches):
+                for scenario in scenarios:
+                    _tally(stats, scenario)
+                rows = [_flatten_scenario(s) for s in scenarios]
+                writer.write_batch(pa.RecordBatch.from_pylist(rows, schema=schema))
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    os.replace(tmp, out_path)
+    return out_path
+
+
+def convert_and_save(records: Iterable[dict], output: str = "json") -> dict:
+    """Convert feedback records to scenarios and save to financial dojo dir.
+
+    ``output`` selects the layout: "json" writes one fb_*.json per scenario,
+    "jsonl" appends every scenario to one scenarios.jsonl opened once for
+    the run, and "arrow" writes a columnar Arrow IPC file per run.
+    """
+    if output not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format {output!r}; expected one of {OUTPUT_FORMATS}")
     stats = {"total": 0, "falsePositive": 0, "falseNegative": 0, "truePositive": 0, "benign": 0}
 
-    for record in records:
-        scenario = classify_feedback(record)
-        stats["total"] += 1
-
-        st = scenario["context"]["scenarioType"]
-        if st == "falsePositiveCandidate":
-            stats["falsePositive"] += 1
-        elif st == "falseNegativeCandidate":
-            stats["falseNegative"] += 1
-        elif st == "truePositive":
-            stats["truePositive"] += 1
-        else:
-            stats["benign"] += 1
-
-        # Write scenario file
-        filename = f"fb_{scenario['id'][:8]}.json"
-        out_path = FINANCIAL_DOJO_DIR / filename
-        with open(out_path, "w") as f:
-            json.dump(scenario, f, indent=2)
+    it = iter(records)
+    if output == "arrow":
+        batches = (classify_batch(batch) for batch in iter(lambda: list(islice(it, BATCH_SIZE)), []))
+        out_path = _save_arrow(batches, stats)
+        if out_path:
+            stats["outputPath"] = out_path
+        return stats
+
+    if output == "jsonl":
+        with open(FINANCIAL_DOJO_DIR / JSONL_FILENAME, "ab") as f:
+            while batch := list(islice(it, BATCH_SIZE)):
+                for scenario in classify_batch(batch):
+                    _tally(stats, scenario)
+                    f.write(_json_dumps_line(scenario))
+        return stats
+
+    with ThreadPoolExecutor(max_workers=WRITE_WORKERS) as pool:
+        while batch := list(islice(it, BATCH_SIZE)):
+            scenarios = classify_batch(batch)
+            writes = pool.map(_write_scenario, scenarios)
+
+            for scenario in scenarios:
+                _tally(stats, scenario)
+
+            # Drain before the next batch so write errors surface here
+            for _ in writes:
+                pass
 
     return stats
 
 
 def main():
-    path = sys.argv[1] if len(sys.argv) > 1 else None
-    _log("Loading production feedback...")
-    records = load_feedback(path)
-
-    if not records:
+    args = sys.argv[1:]
+    output = "json"
+    for fmt in ("jsonl", "arrow"):
+        if f"--{fmt}" in args:
+            output = fmt
+            args.remove(f"--{fmt}")
+    path = args[0] if args else None
+    _log("Processing production feedback...")
+    stats = convert_and_save(iter_feedback(path), output=output)
+
+    if not stats["total"]:
         _log("No records to process.")
         return
 
-    _log(f"Processing {len(records)} feedback records...")
-    stats = convert_and_save(records)
-
     _log("Conversion complete:")
     _log(f"  Total:            {stats['total']}")
     _log(f"  False positives:  {stats['falsePositive']}")
     _log(f"  False negatives:  {stats['falseNegative']}")
     _log(f"  True positives:   {stats['truePositive']}")
     _log(f"  Benign baseline:  {stats['benign']}")
-    _log(f"  Output dir:       {FINANCIAL_DOJO_DIR}")
+    if "outputPath" in stats:
+        _log(f"  Output file:      {stats['outputPath']}")
+    else:
+        _log(f"  Output dir:       {FINANCIAL_DOJO_DIR}")
+    cache = _alert_fragments.cache_info()
+    _log(f"  Fragment cache:   {cache.hits} hits / {cache.misses} misses")
 
 
 if __name__ == "__main__":
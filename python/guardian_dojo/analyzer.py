@@ -6,6 +6,7 @@ import json
 import sqlite3
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 from sklearn.metrics import (
     accuracy_score,
@@ -16,6 +17,52 @@ from sklearn.metrics import (
     recall_score,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Lineage generation field → DataFrame column
+GENERATION_COLUMNS = {
+    "generation": "generation",
+    "populationSize": "population_size",
+    "bestFitness": "best_fitness",
+    "avgFitness": "avg_fitness",
+    "bestDetectionRate": "best_detection_rate",
+    "bestFalsePositiveRate": "best_fpr",
+    "distinctSpecializations": "distinct_specializations",
+}
+
+# Lineage tables in the SQLite index. Prompt ids are content hashes and the
+# same text can recur across generations, so neither table is keyed on them.
+INDEX_SCHEMA = """
+DELETE FROM meta WHERE key = 'source';
+DROP TABLE IF EXISTS generations;
+DROP TABLE IF EXISTS prompts;
+CREATE TABLE generations (
+    generation INTEGER,
+    population_size INTEGER,
+    best_fitness REAL,
+    avg_fitness REAL,
+    best_detection_rate REAL,
+    best_fpr REAL,
+    distinct_specializations INTEGER
+);
+CREATE TABLE prompts (
+    id TEXT,
+    generation INTEGER,
+    specialization TEXT,
+    fitness REAL,
+    detection_rate REAL,
+    fpr REAL,
+    prompt_length INTEGER,
+    has_parent INTEGER,
+    mutation TEXT
+);
+CREATE INDEX prompts_generation_specialization ON prompts (generation, specialization);
+"""
+
 
 class GuardianAnalyzer:
     """Analyze Guardian Dojo training results from the encrypted SQLite database.
@@ -24,78 +71,168 @@ class GuardianAnalyzer:
     For analysis, export records to JSON first using the CLI:
         guardian-dojo stats --db-path data/guardian_dojo.db
     Or use the JSON lineage file directly.
+
+    Stats are served from a SQLite index (``<lineage>_index.db``) that is
+    materialized from the JSON once and rebuilt only when the file changes;
+    when that path isn't writable the index is kept in memory.
     """
 
     def __init__(self, lineage_path: str = "data/guardian_lineage.json"):
         self.lineage_path = Path(lineage_path)
         self._lineage: dict | None = None
+        # Derived frames, rebuilt only when the lineage is (re)loaded
+        self._gen_df: pd.DataFrame | None = None
+        self._prompt_df: pd.DataFrame | None = None
+        self._latest_df: pd.DataFrame | None = None
+        # One index connection per analyzer, and the source key it was last checked against
+        self._conn: sqlite3.Connection | None = None
+        self._index_key: str | None = None
 
     def load_lineage(self) -> dict:
         """Load the guardian lineage JSON file."""
         if self._lineage is None:
-            with open(self.lineage_path) as f:
-                self._lineage = json.load(f)
+            self._gen_df = self._prompt_df = self._latest_df = None
+            raw = self.lineage_path.read_bytes()
+            self._lineage = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return self._lineage
 
-    def generation_stats(self) -> pd.DataFrame:
-        """Compute per-generation statistics from lineage data."""
+    @property
+    def index_path(self) -> Path:
+        """SQLite index materialized from the lineage JSON."""
+        return self.lineage_path.with_name(self.lineage_path.stem + "_index.db")
+
+    def ensure_sqlite_index(self) -> sqlite3.Connection:
+        """Materialize the lineage into SQLite tables, rebuilding only when the JSON changes.
+
+        Nothing is written while the on-disk index is fresh. If the index
+        can't be written (e.g. the lineage sits on a read-only mount), it is
+        built in memory for this analyzer instead.
+        """
+        st = self.lineage_path.stat()
+        key = f"{st.st_mtime_ns}:{st.st_size}"
+        if self._conn is not None and self._index_key == key:
+            return self._conn
+
+        if self._conn is None:
+            try:
+                self._conn = sqlite3.connect(self.index_path)
+            except sqlite3.OperationalError:
+                self._conn = sqlite3.connect(":memory:")
+        if self._stored_key(self._conn) != key:
+            try:
+                self._build_index(self._conn, key)
+            except sqlite3.OperationalError:
+                self._conn.close()
+                self._conn = sqlite3.connect(":memory:")
+                self._build_index(self._conn, key)
+        self._index_key = key
+        return self._conn
+
+    @staticmethod
+    def _stored_key(conn: sqlite3.Connection) -> str | None:
+        """Source key the index was built from, read without writing anything."""
+        try:
+            row = conn.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        except sqlite3.OperationalError:  # no index yet, or the file can't be opened
+            return None
+        return row[0] if row is not None else None
+
+    def _build_index(self, conn: sqlite3.Connection, key: str) -> None:
+        """(Re)build the lineage tables in ``conn`` and record ``key`` as their source."""
+        # The source key is cleared first and written last, so an interrupted
+        # rebuild is never mistaken for a fresh index. The key was taken
+        # before this read, so a file changed since just means another
+        # rebuild next time.
+        self.refresh()
         lineage = self.load_lineage()
+        conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        conn.executescript(INDEX_SCHEMA)
+        for table, df in (
+            ("generations", self._generation_frame(lineage)),
+            ("prompts", self._prompt_frame(lineage)),
+        ):
+            if not df.empty:
+                df.to_sql(table, conn, if_exists="append", index=False)
+        with conn:
+            conn.execute("INSERT OR REPLACE INTO meta VALUES ('source', ?)", (key,))
+
+    def _query(self, sql: str) -> pd.DataFrame:
+        """Run a query against the (fresh) SQLite index."""
+        return pd.read_sql_query(sql, self.ensure_sqlite_index())
+
+    def refresh(self) -> None:
+        """Drop the loaded lineage and derived frames so the next call re-reads."""
+        self._lineage = None
+        self._gen_df = self._prompt_df = self._latest_df = None
+
+    @staticmethod
+    def _generation_frame(lineage: dict) -> pd.DataFrame:
+        """Build the per-generation frame straight from lineage JSON."""
         generations = lineage.get("generations", [])
         if not generations:
             return pd.DataFrame()
+        df = pd.DataFrame.from_records(generations, columns=list(GENERATION_COLUMNS))
+        return df.rename(columns=GENERATION_COLUMNS)
 
-        rows = []
-        for gen in generations:
-            rows.append(
-                {
-                    "generation": gen["generation"],
-                    "population_size": gen["populationSize"],
-                    "best_fitness": gen["bestFitness"],
-                    "avg_fitness": gen["avgFitness"],
-                    "best_detection_rate": gen["bestDetectionRate"],
-                    "best_fpr": gen["bestFalsePositiveRate"],
-                    "distinct_specializations": gen["distinctSpecializations"],
-                }
-            )
-        return pd.DataFrame(rows)
-
-    def prompt_stats(self) -> pd.DataFrame:
-        """Compute per-prompt statistics from lineage data."""
-        lineage = self.load_lineage()
+    @staticmethod
+    def _prompt_frame(lineage: dict) -> pd.DataFrame:
+        """Build the per-prompt frame straight from lineage JSON."""
         prompts = lineage.get("prompts", [])
         if not prompts:
             return pd.DataFrame()
 
-        rows = []
-        for p in prompts:
-            rows.append(
-                {
-                    "id": p["id"]["hash"],
-                    "generation": p["generation"],
-                    "specialization": p["specialization"],
-                    "fitness": p["fitness"],
-                    "detection_rate": p["detectionRate"],
-                    "fpr": p["falsePositiveRate"],
-                    "prompt_length": len(p["promptText"]),
-                    "has_parent": p.get("parentId") is not None,
-                    "mutation": p.get("mutationDescription", "seed"),
-                }
+        flat = pd.json_normalize(prompts)
+        mutation = flat["mutationDescription"] if "mutationDescription" in flat else None
+        return pd.DataFrame(
+            {
+                "id": flat["id.hash"],
+                "generation": flat["generation"],
+                "specialization": flat["specialization"],
+                "fitness": flat["fitness"],
+                "detection_rate": flat["detectionRate"],
+                "fpr": flat["falsePositiveRate"],
+                "prompt_length": flat["promptText"].str.len().to_numpy(),
+                # parentId flattens to parentId.hash (or stays parentId when null)
+                "has_parent": flat.filter(regex=r"^parentId(\.|$)").notna().any(axis=1),
+                "mutation": "seed" if mutation is None else mutation.fillna("seed"),
+            }
+        )
+
+    def generation_stats(self) -> pd.DataFrame:
+        """Compute per-generation statistics from the lineage index (cached)."""
+        if self._gen_df is None:
+            self._gen_df = self._query("SELECT * FROM generations ORDER BY rowid")
+        return self._gen_df
+
+    def prompt_stats(self) -> pd.DataFrame:
+        """Compute per-prompt statistics from the lineage index (cached)."""
+        if self._prompt_df is None:
+            df = self._query("SELECT * FROM prompts ORDER BY rowid")
+            df["has_parent"] = df["has_parent"].astype(bool)
+            self._prompt_df = df
+        return self._prompt_df
+
+    def latest_generation_prompts(self) -> pd.DataFrame:
+        """Prompts from the most recent generation (cached).
+
+        Answered by the (generation, specialization) index, so neither the
+        full prompt frame nor a boolean scan over it is needed.
+        """
+        if self._latest_df is None:
+            df = self._query(
+                "SELECT * FROM prompts"
+                " WHERE generation = (SELECT MAX(generation) FROM prompts) ORDER BY rowid"
             )
-        return pd.DataFrame(rows)
+            df["has_parent"] = df["has_parent"].astype(bool)
+            self._latest_df = df
+        return self._latest_df
 
     def specialization_breakdown(self) -> pd.DataFrame:
         """Count prompts by specialization across all generations."""
         df = self.prompt_stats()
         if df.empty:
             return df
-        return (
-            df.groupby(["generation", "specialization"])
-            .size()
-            .reset_index(name="count")
-            .pivot(index="generation", columns="specialization", values="count")
-            .fillna(0)
-            .astype(int)
-        )
+        return pd.crosstab(df["generation"], df["specialization"]).astype(np.int32)
 
     def fitness_trend(self) -> pd.DataFrame:
         """Extract best and average fitness per generation."""
@@ -112,10 +249,14 @@ class GuardianAnalyzer:
 
         lines = ["=== Guardian Gym Analysis Report ===", ""]
 
+        best = self._query(
+            "SELECT MAX(best_fitness) AS fitness, MAX(best_detection_rate) AS detection,"
+            " MIN(best_fpr) AS fpr FROM generations"
+        ).iloc[0]
         lines.append(f"Total generations: {len(gen_df)}")
-        lines.append(f"Best fitness achieved: {gen_df['best_fitness'].max():.3f}")
-        lines.append(f"Best detection rate: {gen_df['best_detection_rate'].max():.1%}")
-        lines.append(f"Lowest FPR: {gen_df['best_fpr'].min():.1%}")
+        lines.append(f"Best fitness achieved: {best['fitness']:.3f}")
+        lines.append(f"Best detection rate: {best['detection']:.1%}")
+        lines.append(f"Lowest FPR: {best['fpr']:.1%}")
         lines.append("")
 
         # Fitness progression
@@ -129,12 +270,10 @@ class GuardianAnalyzer:
             lines.append(f"  Improvement: {improvement:+.3f}")
 
         # Specialization diversity
-        prompt_df = self.prompt_stats()
-        if not prompt_df.empty:
+        latest = self.latest_generation_prompts()
+        if not latest.empty:
             lines.append("")
             lines.append("Specialization distribution (latest generation):")
-            latest_gen = prompt_df["generation"].max()
-            latest = prompt_df[prompt_df["generation"] == latest_gen]
             for spec, count in latest["specialization"].value_counts().items():
                 lines.append(f"  {spec}: {count}")
 
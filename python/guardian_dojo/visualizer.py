@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
 from .analyzer import GuardianAnalyzer
@@ -15,6 +16,30 @@ class GuardianVisualizer:
 
     def __init__(self, lineage_path: str = "data/guardian_lineage.json"):
         self.analyzer = GuardianAnalyzer(lineage_path=lineage_path)
+        self._fig: plt.Figure | None = None
+
+    def _figure(self) -> plt.Figure:
+        """Return the shared 10x6 figure, cleared for the next plot."""
+        if self._fig is None or not plt.fignum_exists(self._fig.number):
+            self._fig = plt.figure(figsize=(10, 6))
+        else:
+            self._fig.clf()
+        return self._fig
+
+    def _finish(self, fig: plt.Figure, output: str | None) -> None:
+        """Save the figure to ``output`` or show it interactively."""
+        fig.tight_layout()
+        if output:
+            fig.savefig(output, dpi=150)
+            print(f"Saved to {output}")
+        else:
+            plt.show()
+
+    def close(self) -> None:
+        """Release the shared figure."""
+        if self._fig is not None:
+            plt.close(self._fig)
+            self._fig = None
 
     def plot_fitness_trend(self, output: str | None = None) -> None:
         """Plot best and average fitness across generations."""
@@ -23,7 +48,8 @@ class GuardianVisualizer:
             print("No data to plot.")
             return
 
-        fig, ax1 = plt.subplots(figsize=(10, 6))
+        fig = self._figure()
+        ax1 = fig.add_subplot()
 
         ax1.plot(df["generation"], df["best_fitness"], "b-o", label="Best Fitness", linewidth=2)
         ax1.plot(df["generation"], df["avg_fitness"], "b--s", label="Avg Fitness", alpha=0.7)
@@ -46,14 +72,8 @@ class GuardianVisualizer:
         lines2, labels2 = ax2.get_legend_handles_labels()
         ax1.legend(lines1 + lines2, labels1 + labels2, loc="center right")
 
-        plt.title("Guardian Evolution — Fitness Trend")
-        plt.tight_layout()
-
-        if output:
-            plt.savefig(output, dpi=150)
-            print(f"Saved to {output}")
-        else:
-            plt.show()
+        ax2.set_title("Guardian Evolution — Fitness Trend")
+        self._finish(fig, output)
 
     def plot_specialization_heatmap(self, output: str | None = None) -> None:
         """Plot a heatmap of specialization distribution across generations."""
@@ -62,62 +82,59 @@ class GuardianVisualizer:
             print("No data to plot.")
             return
 
-        fig, ax = plt.subplots(figsize=(10, 6))
-        im = ax.imshow(df.T.values, aspect="auto", cmap="YlOrRd")
+        counts = df.T.to_numpy()
+        fig = self._figure()
+        ax = fig.add_subplot()
+        im = ax.imshow(counts, aspect="auto", cmap="YlOrRd")
 
         ax.set_xticks(range(len(df.index)))
         ax.set_xticklabels([f"Gen {g}" for g in df.index])
         ax.set_yticks(range(len(df.columns)))
         ax.set_yticklabels(df.columns)
 
-        for i in range(len(df.columns)):
-            for j in range(len(df.index)):
-                val = int(df.T.iloc[i, j])
-                ax.text(j, i, str(val), ha="center", va="center", color="black" if val < 3 else "white")
-
-        plt.colorbar(im, ax=ax, label="Count")
-        plt.title("Guardian Specialization Distribution by Generation")
-        plt.xlabel("Generation")
-        plt.ylabel("Specialization")
-        plt.tight_layout()
+        # Labels and colors come from the flat count array, not per-cell .iloc
+        rows, cols = np.indices(counts.shape)
+        colors = np.where(counts < 3, "black", "white")
+        for i, j, val, color in zip(
+            rows.ravel().tolist(), cols.ravel().tolist(), counts.ravel().tolist(), colors.ravel().tolist()
+        ):
+            ax.text(j, i, str(val), ha="center", va="center", color=color)
 
-        if output:
-            plt.savefig(output, dpi=150)
-            print(f"Saved to {output}")
-        else:
-            plt.show()
+        fig.colorbar(im, ax=ax, label="Count")
+        ax.set_title("Guardian Specialization Distribution by Generation")
+        ax.set_xlabel("Generation")
+        ax.set_ylabel("Specialization")
+        self._finish(fig, output)
 
     def plot_detection_by_scenario(self, output: str | None = None) -> None:
         """Plot detection rates by scenario type (from prompt fitness data)."""
-        prompt_df = self.analyzer.prompt_stats()
-        if prompt_df.empty:
+        latest = self.analyzer.latest_generation_prompts()
+        if latest.empty:
             print("No data to plot.")
             return
 
-        latest_gen = prompt_df["generation"].max()
-        latest = prompt_df[prompt_df["generation"] == latest_gen]
+        latest_gen = latest["generation"].iloc[0]
 
-        fig, ax = plt.subplots(figsize=(10, 6))
+        fig = self._figure()
+        ax = fig.add_subplot()
         specs = latest.groupby("specialization")["detection_rate"].mean().sort_values()
         specs.plot(kind="barh", ax=ax, color="steelblue")
         ax.set_xlabel("Average Detection Rate")
         ax.set_title(f"Detection Rate by Specialization (Gen {int(latest_gen)})")
         ax.axvline(x=0.95, color="green", linestyle="--", label="Target (95%)")
         ax.legend()
-        plt.tight_layout()
-
-        if output:
-            plt.savefig(output, dpi=150)
-            print(f"Saved to {output}")
-        else:
-            plt.show()
+        self._finish(fig, output)
 
 
 if __name__ == "__main__":
     import sys
 
+    # Batch mode only writes PNGs — skip interactive backend startup
+    plt.switch_backend("Agg")
+
     path = sys.argv[1] if len(sys.argv) > 1 else "data/guardian_lineage.json"
     viz = GuardianVisualizer(lineage_path=path)
     viz.plot_fitness_trend("data/fitness_trend.png")
     viz.plot_specialization_heatmap("data/specialization_heatmap.png")
     viz.plot_detection_by_scenario("data/detection_by_scenario.png")
+    viz.close()
@@ -12,19 +12,90 @@ Two-stage pipeline:
 Runs fully on-device. Reads local files only.
 
 Output:
-  ~/.config/observer/attack_patterns/   → structured attack playbooks (JSON)
+  ~/.config/observer/attack_patterns/   → structured attack playbooks (JSONL, one file per day)
 """
 
 import json
+import os
 import re
+import uuid
+from contextlib import ExitStack
 from pathlib import Path
 from datetime import datetime, timezone
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from dojo_files import list_files
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback — same data, just slower
+    orjson = None
+
 # ==================== PATHS ====================
-RAW_DIR = Path.home() / ".config" / "observer" / "raw"
-PATTERNS_DIR = Path.home() / ".config" / "observer" / "attack_patterns"
+OBSERVER_DIR = Path.home() / ".config" / "observer"
+RAW_DIR = OBSERVER_DIR / "raw"
+PATTERNS_DIR = OBSERVER_DIR / "attack_patterns"
 PATTERNS_DIR.mkdir(parents=True, exist_ok=True)
-EXTRACTED_LOG = Path.home() / ".config" / "observer" / "extracted.json"
+# One compact line per pattern file with just what show_stats needs
+PATTERNS_INDEX = PATTERNS_DIR / "patterns_index.ndjson"
+AGENT_DOJO_DIR = OBSERVER_DIR / "scenarios" / "agent_dojo"
+GUARDIAN_DOJO_DIR = OBSERVER_DIR / "scenarios" / "guardian_dojo"
+AGENT_DOJO_DIR.mkdir(parents=True, exist_ok=True)
+GUARDIAN_DOJO_DIR.mkdir(parents=True, exist_ok=True)
+EXTRACTED_LOG = OBSERVER_DIR / "extracted.txt"  # one post id per line
+LEGACY_EXTRACTED_LOG = OBSERVER_DIR / "extracted.json"
+# Written by moltbook_bridge: raw post files stored since the last extraction.
+PENDING_LOG = OBSERVER_DIR / "pending.txt"
+PENDING_CLAIMED = OBSERVER_DIR / "pending.claimed"
+# Written once a full scan of the raw dir has completed. Until then the queue
+# can't be trusted (posts stored before the bridge queued are not in it), so
+# extract_all rescans the whole raw dir.
+PENDING_ACTIVE = OBSERVER_DIR / "pending.active"
+
+# Classification is regex-bound, so large backlogs fan out across processes.
+# Below PARALLEL_MIN_POSTS, worker startup costs more than it saves.
+EXTRACT_WORKERS = os.cpu_count() or 1
+PARALLEL_MIN_POSTS = 2000
+
+
+# ==================== JSON ====================
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _json_line(obj) -> bytes:
+    """Serialize to one compact, newline-terminated JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, separators=(",", ":")).encode() + b"\n"
+
+
+def _write_json(path: Path, obj):
+    """Write indented JSON via a temp file + rename, so readers never see a torn file."""
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(_json_dumps(obj))
+    os.replace(tmp, path)
+
 
 # ==================== ATTACK TAXONOMY ====================
 # Maps to both dojo scenario types
@@ -126,6 +197,93 @@ DOCUMENTATION_STRUCTURE = [
     r"flagging an active",
 ]
 
+# Compiled once at import — the hot loops below reuse these per post instead of
+# going back through re's pattern cache on every call. Markers and structure
+# patterns run against lowercased content: one .lower() copy is far cheaper
+# than IGNORECASE matching in every pattern.
+for _config in ATTACK_CATEGORIES.values():
+    _config["markers"] = [re.compile(p) for p in _config["markers"]]
+DOCUMENTATION_STRUCTURE = [re.compile(p, re.MULTILINE) for p in DOCUMENTATION_STRUCTURE]
+
+# Leading indent is [^\S\n]*, not \s*: a \s* that can cross newlines gets
+# re-run from every line start inside a blank run, which is quadratic in
+# the run length. The same lines match either way.
+NUMBERED_STEP_RE = re.compile(r'^[^\S\n]*(\d+)\.\s+(.+)$', re.MULTILINE)
+BOLD_SECTION_RE = re.compile(r'\*\*([^*]+)\*\*:?\s*\n((?:(?!\*\*).+\n?)*)')
+DASH_ITEM_RE = re.compile(r'^[^\S\n]*[-•]\s+(.+)$', re.MULTILINE)
+DEFENSE_HEADER_RE = re.compile(
+    r"(what we need|how to (fix|defend|protect|detect|mitigate)|recommendation|solution|defense|countermeasure)"
+)
+NUMBERED_BOLD_RE = re.compile(r'^[^\S\n]*\d+\.\s+\*\*(.+?)\*\*', re.MULTILINE)
+
+
+def _required_literals(items) -> tuple[str, ...] | None:
+    """Pick literals of which at least one must occur for a parsed regex to match.
+
+    Walks the top level of the parse tree and keeps the candidate set whose
+    shortest literal is longest. Returns None when nothing is required.
+    """
+    best, run = None, []
+
+    def consider(candidates):
+        nonlocal best
+        if candidates and (best is None or min(map(len, candidates)) > min(map(len, best))):
+            best = candidates
+
+    for op, av in items:
+        if op is sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            consider(("".join(run),))
+            run = []
+        if op is sre_parse.SUBPATTERN:
+            consider(_required_literals(av[-1]))
+        elif op is sre_parse.BRANCH:
+            alternatives = [_required_literals(alt) for alt in av[1]]
+            if all(alternatives):
+                consider(tuple(lit for alt in alternatives for lit in alt))
+        elif op is sre_parse.IN and all(o is sre_parse.LITERAL for o, _ in av):
+            consider(tuple(chr(c) for _, c in av))
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT) and av[0] >= 1:
+            consider(_required_literals(av[2]))
+    if run:
+        consider(("".join(run),))
+    return best
+
+
+# Literal anchors per marker and structure pattern: a pattern whose anchors are
+# all absent from the lowercased post cannot match, so its regex is skipped
+MARKERS = [p for config in ATTACK_CATEGORIES.values() for p in config["markers"]]
+PATTERN_ANCHORS = {
+    pattern: _required_literals(sre_parse.parse(pattern.pattern))
+    for pattern in DOCUMENTATION_STRUCTURE + MARKERS
+}
+_UNANCHORED = frozenset(p for p, anchors in PATTERN_ANCHORS.items() if anchors is None)
+
+if ahocorasick is not None:
+    _ANCHOR_AUTOMATON = ahocorasick.Automaton()
+    _ANCHOR_PATTERNS = {}
+    for _pattern, _anchors in PATTERN_ANCHORS.items():
+        for _anchor in _anchors or ():
+            _ANCHOR_AUTOMATON.add_word(_anchor, _anchor)
+            _ANCHOR_PATTERNS.setdefault(_anchor, []).append(_pattern)
+    _ANCHOR_AUTOMATON.make_automaton()
+
+
+def _live_patterns(cl: str, patterns) -> set:
+    """Membership set: which of ``patterns`` have an anchor in the lowercased content."""
+    if ahocorasick is not None:
+        hits = {anchor for _, anchor in _ANCHOR_AUTOMATON.iter(cl)}
+        live = set(_UNANCHORED.intersection(patterns))
+        for anchor in hits:
+            live.update(_ANCHOR_PATTERNS[anchor])
+        return live
+    return {
+        pattern for pattern in patterns
+        if PATTERN_ANCHORS[pattern] is None or any(a in cl for a in PATTERN_ANCHORS[pattern])
+    }
+
 
 # ==================== STAGE 1: HEURISTIC TAGGER ====================
 
@@ -133,22 +291,28 @@ def classify_post(content: str) -> dict | None:
     """Identify if a post documents attack patterns and classify them.
     Returns None if not an attack-documentation post."""
     cl = content.lower()
+    live = _live_patterns(cl, DOCUMENTATION_STRUCTURE)
 
     # Must have documentation structure (not just topic mention)
     doc_score = 0
     for pattern in DOCUMENTATION_STRUCTURE:
-        if re.search(pattern, cl, re.MULTILINE):
+        if pattern in live and pattern.search(cl):
             doc_score += 1
 
     if doc_score == 0:
         return None  # doesn't document anything — just mentions a topic
 
-    # Classify by attack category
+    # Classify by attack category. Markers are scanned one by one on purpose:
+    # a fused alternation loses re's literal-prefix search (2-3x slower here),
+    # and a single finditer pass would drop hits that overlap across categories.
     matched_categories = {}
+    live = _live_patterns(cl, MARKERS)
     for category, config in ATTACK_CATEGORIES.items():
         cat_matches = []
         for pattern in config["markers"]:
-            found = re.findall(pattern, cl)
+            if pattern not in live:
+                continue
+            found = pattern.findall(cl)
             if found:
                 cat_matches.extend(
                     [f if isinstance(f, str) else str(f) for f in found]
@@ -175,13 +339,13 @@ def extract_attack_steps(content: str) -> list[str]:
     steps = []
 
     # Numbered steps: "1. ...", "2. ...", etc.
-    numbered = re.findall(r'^\s*(\d+)\.\s+(.+)$', content, re.MULTILINE)
+    numbered = NUMBERED_STEP_RE.findall(content)
     if numbered:
         for num, text in numbered:
             steps.append(f"{num}. {text.strip()}")
 
     # Bold sections: "**The attack:**" etc.
-    bold_sections = re.findall(r'\*\*([^*]+)\*\*:?\s*\n((?:(?!\*\*).+\n?)*)', content)
+    bold_sections = BOLD_SECTION_RE.findall(content)
     for header, body in bold_sections:
         cleaned = body.strip()[:300]
         if cleaned:
@@ -189,7 +353,7 @@ def extract_attack_steps(content: str) -> list[str]:
 
     # Dash-listed items under attack headers
     if not steps:
-        dash_items = re.findall(r'^\s*[-•]\s+(.+)$', content, re.MULTILINE)
+        dash_items = DASH_ITEM_RE.findall(content)
         steps = [f"- {item.strip()}" for item in dash_items[:10]]
 
     return steps[:15]  # cap
@@ -198,16 +362,12 @@ def extract_attack_steps(content: str) -> list[str]:
 def extract_countermeasures(content: str) -> list[str]:
     """Extract defensive recommendations from post."""
     countermeasures = []
-    cl = content.lower()
 
     # Look for defensive sections
-    defense_headers = [
-        r"(what we need|how to (fix|defend|protect|detect|mitigate)|recommendation|solution|defense|countermeasure)",
-    ]
     in_defense = False
     for line in content.split("\n"):
         ll = line.lower().strip()
-        if any(re.search(p, ll) for p in defense_headers):
+        if DEFENSE_HEADER_RE.search(ll):
             in_defense = True
             continue
         if in_defense and line.strip().startswith(("-", "•", "*")):
@@ -216,7 +376,7 @@ def extract_countermeasures(content: str) -> list[str]:
             in_defense = False
 
     # Also grab numbered defense steps
-    for match in re.finditer(r'^\s*\d+\.\s+\*\*(.+?)\*\*', content, re.MULTILINE):
+    for match in NUMBERED_BOLD_RE.finditer(content):
         if any(kw in match.group(1).lower() for kw in ["sign", "audit", "verify", "sandbox", "monitor", "permission"]):
             countermeasures.append(match.group(1))
 
@@ -225,8 +385,9 @@ def extract_countermeasures(content: str) -> list[str]:
 
 # ==================== PATTERN → DOJO SCENARIO ====================
 
-def pattern_to_agent_dojo(pattern: dict) -> dict:
-    """Convert an extracted attack pattern into an Agent Dojo scenario seed."""
+def pattern_to_agent_dojo(pattern: dict, now_iso: str | None = None) -> dict:
+    """Convert an extracted attack pattern into an Agent Dojo scenario seed.
+    ``now_iso`` lets a batch stamp every scenario with one timestamp."""
     cat = pattern["primary_category"]
     config = ATTACK_CATEGORIES.get(cat, {})
 
@@ -245,14 +406,14 @@ def pattern_to_agent_dojo(pattern: dict) -> dict:
             "submolt": pattern["submolt"],
             "allCategories": pattern["all_categories"],
             "countermeasures": pattern.get("countermeasures", []),
-            "convertedAt": datetime.now(timezone.utc).isoformat(),
+            "convertedAt": now_iso or datetime.now(timezone.utc).isoformat(),
         },
     }
 
 
-def pattern_to_guardian_dojo(pattern: dict) -> dict:
-    """Convert an extracted attack pattern into a Guardian Dojo scenario."""
-    import uuid
+def pattern_to_guardian_dojo(pattern: dict, now_iso: str | None = None) -> dict:
+    """Convert an extracted attack pattern into a Guardian Dojo scenario.
+    ``now_iso`` lets a batch stamp every scenario with one timestamp."""
     cat = pattern["primary_category"]
     config = ATTACK_CATEGORIES.get(cat, {})
 
@@ -287,7 +448,7 @@ def pattern_to_guardian_dojo(pattern: dict) -> dict:
             "submolt": pattern["submolt"],
             "attackCategory": cat,
             "countermeasures": pattern.get("countermeasures", []),
-            "convertedAt": datetime.now(timezone.utc).isoformat(),
+            "convertedAt": now_iso or datetime.now(timezone.utc).isoformat(),
         },
     }
 
@@ -296,97 +457,162 @@ def pattern_to_guardian_dojo(pattern: dict) -> dict:
 
 def load_extracted() -> set:
     if EXTRACTED_LOG.exists():
-        return set(json.loads(EXTRACTED_LOG.read_text()))
+        return set(EXTRACTED_LOG.read_text().splitlines())
+    if LEGACY_EXTRACTED_LOG.exists():
+        # One-time migration from the old sorted-JSON-list format
+        ids = set(_json_loads(LEGACY_EXTRACTED_LOG.read_bytes()))
+        save_extracted(ids)
+        LEGACY_EXTRACTED_LOG.unlink()
+        return ids
     return set()
 
 
 def save_extracted(ids: set):
-    EXTRACTED_LOG.write_text(json.dumps(sorted(ids)))
+    """Append newly extracted post ids — the log is never rewritten."""
+    if ids:
+        with EXTRACTED_LOG.open("a") as f:
+            f.writelines(f"{pid}\n" for pid in sorted(ids))
+
+
+def claim_pending() -> list[str] | None:
+    """Take over the bridge's queue of new raw posts.
+    Returns None when the queue isn't trusted yet and the raw dir must be scanned.
+    The queue is claimed either way, before any listing, so posts stored from
+    here on land in a fresh queue for the next run."""
+    if not PENDING_CLAIMED.exists():  # else: left over from an interrupted run
+        try:
+            PENDING_LOG.replace(PENDING_CLAIMED)
+        except FileNotFoundError:
+            PENDING_CLAIMED.touch()
+    if not PENDING_ACTIVE.exists():
+        return None
+    names = dict.fromkeys(PENDING_CLAIMED.read_text().splitlines())
+    return sorted(p for p in (os.path.join(RAW_DIR, n) for n in names if n) if os.path.exists(p))
+
+
+def release_pending(full_scan: bool):
+    """Drop the claimed queue once its posts are extracted. After a full scan,
+    mark the queue as trusted from now on."""
+    if full_scan:
+        PENDING_ACTIVE.touch()
+    PENDING_CLAIMED.unlink(missing_ok=True)
+
+
+_known_ids: set = set()
+
+
+def _init_worker(known: set):
+    """Give a worker the ids that earlier runs already extracted."""
+    global _known_ids
+    _known_ids = known
+
+
+def _process_post(path: str) -> tuple[str, dict | None]:
+    """Read and classify one raw post.
+    Returns (post id, pattern), with pattern None for posts that yield nothing."""
+    with open(path, "rb") as f:
+        data = _json_loads(f.read())
+    pid = data.get("id", os.path.splitext(os.path.basename(path))[0])
+    if pid in _known_ids:
+        return pid, None
+
+    content = data.get("content", "") or ""
+    if len(content) < 200:
+        return pid, None  # too short to be a real writeup
+
+    classification = classify_post(content)
+    if not classification:
+        return pid, None
+
+    # Extract structured data
+    author = data.get("author", {})
+    aname = author.get("name", "unknown") if isinstance(author, dict) else str(author)
+    submolt = data.get("submolt", {})
+    sname = submolt.get("name", "unknown") if isinstance(submolt, dict) else str(submolt)
+
+    return pid, {
+        "post_id": pid,
+        "author": aname,
+        "submolt": sname,
+        "title": (data.get("title") or "")[:200],
+        "summary": content[:1000],
+        "full_content": content,
+        "primary_category": classification["primary_category"],
+        "all_categories": classification["all_categories"],
+        "matched_markers": classification["matched_markers"],
+        "documentation_score": classification["documentation_score"],
+        "attack_steps": extract_attack_steps(content),
+        "countermeasures": extract_countermeasures(content),
+    }
 
 
 def extract_all():
     """Scan raw posts, extract attack patterns, output dojo scenarios."""
-    extracted = load_extracted()
-    ts = int(datetime.now(timezone.utc).timestamp())
-
+    known = load_extracted()
+    extracted = set(known)
+    now = datetime.now(timezone.utc)
+    ts = int(now.timestamp())
+    now_iso = now.isoformat()
+
+    paths = claim_pending()
+    full_scan = paths is None
+    if full_scan:
+        paths = list_files(RAW_DIR, "post_", ".json")
     new_patterns = []
-    for f in sorted(RAW_DIR.glob("post_*.json")):
-        data = json.loads(f.read_text())
-        pid = data.get("id", f.stem)
-        if pid in extracted:
-            continue
-
-        content = data.get("content", "") or ""
-        if len(content) < 200:
+    with ExitStack() as stack:
+        if EXTRACT_WORKERS > 1 and len(paths) >= PARALLEL_MIN_POSTS:
+            # Imported here: multiprocessing is half the script's startup time
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(
+                max_workers=EXTRACT_WORKERS, initializer=_init_worker, initargs=(known,)
+            )
+            # On an error below, don't wait for the remaining posts
+            stack.callback(pool.shutdown, cancel_futures=True)
+            results = pool.map(_process_post, paths, chunksize=16)
+        else:
+            _init_worker(known)
+            results = map(_process_post, paths)
+
+        # Merge in file order, as results arrive, so the first file wins
+        # when a post id repeats
+        for pid, pattern in results:
+            if pid in extracted:
+                continue
             extracted.add(pid)
-            continue  # too short to be a real writeup
-
-        classification = classify_post(content)
-        if not classification:
-            extracted.add(pid)
-            continue
-
-        # Extract structured data
-        author = data.get("author", {})
-        aname = author.get("name", "unknown") if isinstance(author, dict) else str(author)
-        submolt = data.get("submolt", {})
-        sname = submolt.get("name", "unknown") if isinstance(submolt, dict) else str(submolt)
-
-        pattern = {
-            "post_id": pid,
-            "author": aname,
-            "submolt": sname,
-            "title": (data.get("title") or "")[:200],
-            "summary": content[:1000],
-            "full_content": content,
-            "primary_category": classification["primary_category"],
-            "all_categories": classification["all_categories"],
-            "matched_markers": classification["matched_markers"],
-            "documentation_score": classification["documentation_score"],
-            "attack_steps": extract_attack_steps(content),
-            "countermeasures": extract_countermeasures(content),
-            "extracted_at": datetime.now(timezone.utc).isoformat(),
-        }
-
-        new_patterns.append(pattern)
-        extracted.add(pid)
+            if pattern:
+                pattern["extracted_at"] = now_iso
+                new_patterns.append(pattern)
 
     if not new_patterns:
         print("No new attack patterns found.")
-        save_extracted(extracted)
+        save_extracted(extracted - known)
+        release_pending(full_scan)
         return
 
-    # Save raw patterns
-    for p in new_patterns:
-        pid_short = p["post_id"][:8]
-        (PATTERNS_DIR / f"pattern_{ts}_{pid_short}.json").write_text(
-            json.dumps(p, indent=2)
-        )
+    # Save raw patterns: one append to the day's shard instead of a file per pattern
+    with (PATTERNS_DIR / f"patterns_{now:%Y%m%d}.jsonl").open("ab") as f:
+        f.write(b"".join(_json_line(p) for p in new_patterns))
+    if PATTERNS_INDEX.exists():  # otherwise show_stats builds it from the files
+        with PATTERNS_INDEX.open("ab") as f:
+            f.writelines(_json_line(index_entry(p)) for p in new_patterns)
 
     # Generate dojo scenarios
     agent_count = 0
     guardian_count = 0
-    agent_dir = Path.home() / ".config" / "observer" / "scenarios" / "agent_dojo"
-    guardian_dir = Path.home() / ".config" / "observer" / "scenarios" / "guardian_dojo"
-    agent_dir.mkdir(parents=True, exist_ok=True)
-    guardian_dir.mkdir(parents=True, exist_ok=True)
 
     for p in new_patterns:
         pid_short = p["post_id"][:8]
 
-        agent_scenario = pattern_to_agent_dojo(p)
-        (agent_dir / f"attack_{ts}_{pid_short}.json").write_text(
-            json.dumps(agent_scenario, indent=2)
-        )
+        agent_scenario = pattern_to_agent_dojo(p, now_iso)
+        _write_json(AGENT_DOJO_DIR / f"attack_{ts}_{pid_short}.json", agent_scenario)
         agent_count += 1
 
-        guardian_scenario = pattern_to_guardian_dojo(p)
-        (guardian_dir / f"attack_{ts}_{pid_short}.json").write_text(
-            json.dumps(guardian_scenario, indent=2)
-        )
+        guardian_scenario = pattern_to_guardian_dojo(p, now_iso)
+        _write_json(GUARDIAN_DOJO_DIR / f"attack_{ts}_{pid_short}.json", guardian_scenario)
         guardian_count += 1
 
-    save_extracted(extracted)
+    save_extracted(extracted - known)
+    release_pending(full_scan)
 
     print(f"Extracted {len(new_patterns)} attack patterns:")
     for p in new_patterns:
@@ -400,9 +626,47 @@ def extract_all():
 
 # ==================== STATS ====================
 
+def index_entry(pattern: dict) -> dict:
+    """The slice of a pattern that show_stats reads."""
+    return {
+        "post_id": pattern["post_id"],
+        "author": pattern["author"],
+        "all_categories": pattern["all_categories"],
+        "n_steps": len(pattern.get("attack_steps", [])),
+        "n_defenses": len(pattern.get("countermeasures", [])),
+    }
+
+
+def iter_patterns():
+    """Yield every stored pattern, oldest first.
+
+    Older runs wrote one pattern_*.json file per pattern; those come
+    before the daily patterns_*.jsonl shards.
+    """
+    for path in list_files(PATTERNS_DIR, "pattern_", ".json"):
+        with open(path, "rb") as f:
+            yield _json_loads(f.read())
+    for path in list_files(PATTERNS_DIR, "patterns_", ".jsonl"):
+        with open(path, "rb") as f:
+            lines = f.read().splitlines()
+        for line in lines:
+            if line:
+                yield _json_loads(line)
+
+
+def rebuild_patterns_index():
+    """Write PATTERNS_INDEX from scratch out of the stored patterns."""
+    lines = [_json_line(index_entry(p)) for p in iter_patterns()]
+    tmp = PATTERNS_INDEX.with_suffix(".tmp")
+    tmp.write_bytes(b"".join(lines))
+    os.replace(tmp, PATTERNS_INDEX)
+
+
 def show_stats():
-    pattern_files = list(PATTERNS_DIR.glob("pattern_*.json"))
-    if not pattern_files:
+    if not PATTERNS_INDEX.exists():
+        rebuild_patterns_index()
+    entries = [_json_loads(line) for line in PATTERNS_INDEX.read_bytes().splitlines() if line]
+    if not entries:
         print("No attack patterns extracted yet.")
         return
 
@@ -412,15 +676,14 @@ def show_stats():
     total_steps = 0
     total_defenses = 0
 
-    for f in pattern_files:
-        p = json.loads(f.read_text())
+    for p in entries:
         for cat in p["all_categories"]:
             cat_counts[cat] += 1
         author_counts[p["author"]] += 1
-        total_steps += len(p.get("attack_steps", []))
-        total_defenses += len(p.get("countermeasures", []))
+        total_steps += p["n_steps"]
+        total_defenses += p["n_defenses"]
 
-    print(f"Total attack patterns: {len(pattern_files)}")
+    print(f"Total attack patterns: {len(entries)}")
     print(f"Total attack steps extracted: {total_steps}")
     print(f"Total countermeasures extracted: {total_defenses}")
     print()
@@ -4,28 +4,49 @@
 # Public feed is unauthenticated — no agent identity needed for reads.
 
 import json
+import re
+import shutil
 import time
 import random
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 import sys
 
+from bridge_http import http_get
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback — same data, just slower
+    orjson = None
+
 def printFlush(*args, **kwargs):
     print(*args, **kwargs)
     sys.stdout.flush()
 
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 # ==================== CONFIG ====================
 API_BASE = "https://www.moltbook.com/api/v1"
 
 # Generic paths — nothing links to sovereign/freedom/nexus/gym
-DATA_DIR = Path.home() / ".config" / "observer" / "raw"
+OBSERVER_DIR = Path.home() / ".config" / "observer"
+DATA_DIR = OBSERVER_DIR / "raw"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
+# Raw post files not yet seen by moltbook_attack_extractor, one name per line
+PENDING_LOG = DATA_DIR.parent / "pending.txt"
 
 # Polling: 30 min base ± random jitter so timing isn't mechanical
 POLL_BASE = 1800
 POLL_JITTER = 600  # ±10 min
 
+# Requests in flight at once — overlaps round-trips without tripping rate limits
+HTTP_WORKERS = 8
+
 # Spoofed UA — looks like a normal browser, not Python-urllib
 USER_AGENT = (
     "Mozilla/5.0 (Macintosh; Intel Mac OS X 14_5) "
@@ -36,40 +57,44 @@ USER_AGENT = (
 # ==================== C' REVOCATION ====================
 def c_prime_kill():
     """One biometric tap -> permanent kill. All cached data gone forever."""
-    for f in DATA_DIR.glob("*.json"):
-        f.unlink()
-    if DATA_DIR.exists():
-        DATA_DIR.rmdir()
-    parent = DATA_DIR.parent
-    # Clean up scenario dirs too
-    for sub in ["scenarios/agent_dojo", "scenarios/guardian_dojo", "scenarios"]:
-        d = parent / sub
-        if d.exists():
-            for f in d.glob("*.json"):
-                f.unlink()
-            d.rmdir()
-    processed = parent / "processed.json"
-    if processed.exists():
-        processed.unlink()
-    if parent.exists():
-        try:
-            parent.rmdir()
-        except OSError:
-            pass
+    # A symlinked observer dir points into someone else's tree (~/Documents,
+    # a data volume); removing its target could wipe far more than the cache
+    if OBSERVER_DIR.is_symlink():
+        printFlush(f"Refusing to remove {OBSERVER_DIR}: it is a symlink to {OBSERVER_DIR.readlink()}")
+        exit(1)
+    # Raw posts, scenarios, logs and queues all live under the one root;
+    # rmtree removes symlinks inside it without following them
+    shutil.rmtree(OBSERVER_DIR, ignore_errors=True)
+    if OBSERVER_DIR.exists():
+        printFlush(f"REVOKE incomplete — could not remove everything in {OBSERVER_DIR}")
+        exit(1)
     printFlush("REVOKED — all cached data destroyed.")
     exit(0)
 
 # ==================== Suspicious Scan ====================
+# Only flag formatted PII values in actual content.
+# Each pattern starts at its first separator and checks the leading digits with
+# a lookbehind, so re can skip ahead to '-' / ' ' instead of trying \b\d at
+# every position. Flags exactly the inputs \b\d{3}-\d{2}-\d{4}\b and
+# \b\d{4}[- ]\d{4}[- ]\d{4}[- ]\d{4}\b would.
+PII_PATTERNS = [
+    re.compile(r'-(?<=\b\d{3}-)\d{2}-\d{4}\b'),                    # SSN with dashes (123-45-6789)
+    re.compile(r'[- ](?<=\b\d{4}[- ])\d{4}[- ]\d{4}[- ]\d{4}\b'),  # credit card with separators
+]
+
 def suspicious_scan(raw_bytes: bytes) -> bool:
     """Inbound risk scan — only checks content text, not API metadata.
     Scans the 'content' fields for real PII values."""
-    import re
     # Extract only content/body text — ignore JSON metadata (scores, IDs, timestamps)
     try:
-        data = json.loads(raw_bytes)
+        data = _json_loads(raw_bytes)
     except (json.JSONDecodeError, ValueError):
         return True  # not JSON, let it through
+    return scan_payload(data)
+
 
+def scan_payload(data: dict) -> bool:
+    """suspicious_scan for a payload the caller has already decoded."""
     # Gather all content text from posts and comments
     content_parts = []
     for post in data.get("posts", data.get("comments", [])):
@@ -84,13 +109,8 @@ def suspicious_scan(raw_bytes: bytes) -> bool:
     if not text:
         return True
 
-    # Only flag formatted PII values in actual content
-    pii_patterns = [
-        r'\b\d{3}-\d{2}-\d{4}\b',               # SSN with dashes (123-45-6789)
-        r'\b\d{4}[- ]\d{4}[- ]\d{4}[- ]\d{4}\b',  # credit card with separators
-    ]
-    for pattern in pii_patterns:
-        if re.search(pattern, text):
+    for pattern in PII_PATTERNS:
+        if pattern.search(text):
             printFlush("Suspicious: real PII value in content, discarding")
             return False
     return True
@@ -101,6 +121,12 @@ def store_record(data: dict, filename: str):
     path = DATA_DIR / filename
     path.write_text(json.dumps(data, indent=2))
 
+
+def queue_for_extraction(filename: str):
+    """Queue a stored post so the attack extractor only reads new files."""
+    with PENDING_LOG.open("a") as f:
+        f.write(f"{filename}\n")
+
 # Submolts where bot manipulation is concentrated
 TARGET_SUBMOLTS = ["crypto", "security", "trading", "agentfinance", "introductions"]
 
@@ -116,6 +142,23 @@ TARGET_SEARCHES = [
     "run+this+command",
 ]
 
+# ==================== HTTP ====================
+# Pool threads keep their connections (bridge_http) between cycles, so a
+# cycle pays for a TLS handshake per worker instead of per request.
+_http_pool: ThreadPoolExecutor | None = None
+
+
+def _fetch(url: str, headers: dict, timeout: int) -> bytes:
+    return http_get(url, headers, timeout)[2]
+
+
+def _prefetch(url: str, headers: dict, timeout: int) -> Future:
+    """Start a GET in the background; result() returns the body or re-raises."""
+    global _http_pool
+    if _http_pool is None:
+        _http_pool = ThreadPoolExecutor(max_workers=HTTP_WORKERS)
+    return _http_pool.submit(_fetch, url, headers, timeout)
+
 # ==================== Single Cycle ====================
 def run_cycle(seen_ids: set, cycle: int, sorts: list[str] | None = None):
     """Run one observation cycle. Returns count of new posts stored."""
@@ -127,44 +170,47 @@ def run_cycle(seen_ids: set, cycle: int, sorts: list[str] | None = None):
     total_new = 0
 
     # 1. Feed pulls (hot+new across all submolts)
-    for sort in sorts:
-        total_new += _pull_feed(f"posts?sort={sort}&limit=25", f"{sort}", seen_ids, cycle, headers)
+    feeds = [(f"posts?sort={sort}&limit=25", f"{sort}") for sort in sorts]
 
     # 2. Always pull crypto and trading (where scam content lives)
     for primary in ["crypto", "trading"]:
         for sort in sorts:
-            total_new += _pull_feed(
-                f"posts?sort={sort}&limit=15&submolt={primary}", f"s/{primary}/{sort}",
-                seen_ids, cycle, headers
-            )
+            feeds.append((f"posts?sort={sort}&limit=15&submolt={primary}", f"s/{primary}/{sort}"))
 
     # 3. Rotate through bonus submolts
     bonus_submolts = ["security", "agentfinance", "introductions"]
     bonus = bonus_submolts[cycle % len(bonus_submolts)]
-    total_new += _pull_feed(
-        f"posts?sort=new&limit=15&submolt={bonus}", f"s/{bonus}",
-        seen_ids, cycle, headers
-    )
+    feeds.append((f"posts?sort=new&limit=15&submolt={bonus}", f"s/{bonus}"))
 
     # 4. Targeted search (rotate — one query per cycle)
     query = TARGET_SEARCHES[cycle % len(TARGET_SEARCHES)]
-    total_new += _pull_search(query, seen_ids, cycle, headers)
+
+    # Every request goes out up front; results are still handled in order,
+    # so dedupe against seen_ids works exactly as with sequential pulls
+    fetched = [_prefetch(f"{API_BASE}/{endpoint}", headers, 15) for endpoint, _ in feeds]
+    search = _prefetch(f"{API_BASE}/search?q={query}&limit=10", headers, 15)
+
+    for (endpoint, label), raw in zip(feeds, fetched):
+        total_new += _pull_feed(endpoint, label, seen_ids, cycle, headers, raw)
+    total_new += _pull_search(query, seen_ids, cycle, headers, search)
 
     return total_new
 
 
-def _pull_feed(endpoint: str, label: str, seen_ids: set, cycle: int, headers: dict) -> int:
-    """Pull posts from a feed endpoint."""
+def _pull_feed(endpoint: str, label: str, seen_ids: set, cycle: int, headers: dict,
+               fetched: Future | None = None) -> int:
+    """Pull posts from a feed endpoint (or from an already started fetch of it)."""
     try:
-        req = Request(f"{API_BASE}/{endpoint}", headers=headers)
-        with urlopen(req, timeout=15) as resp:
-            raw = resp.read()
+        if fetched is None:
+            fetched = _prefetch(f"{API_BASE}/{endpoint}", headers, 15)
+        raw = fetched.result()
 
-        if not suspicious_scan(raw):
+        # Decode once; the scan works on the parsed payload
+        feed = _json_loads(raw)
+        if not scan_payload(feed):
             printFlush(f"Cycle {cycle} [{label}]: payload discarded by scan")
             return 0
 
-        feed = json.loads(raw)
         posts = feed.get("posts", [])
         return _store_posts(posts, seen_ids, cycle, label, headers)
 
@@ -175,18 +221,19 @@ def _pull_feed(endpoint: str, label: str, seen_ids: set, cycle: int, headers: di
     return 0
 
 
-def _pull_search(query: str, seen_ids: set, cycle: int, headers: dict) -> int:
-    """Pull posts from search."""
+def _pull_search(query: str, seen_ids: set, cycle: int, headers: dict,
+                 fetched: Future | None = None) -> int:
+    """Pull posts from search (or from an already started fetch of it)."""
     label = f"search:{query}"
     try:
-        req = Request(f"{API_BASE}/search?q={query}&limit=10", headers=headers)
-        with urlopen(req, timeout=15) as resp:
-            raw = resp.read()
+        if fetched is None:
+            fetched = _prefetch(f"{API_BASE}/search?q={query}&limit=10", headers, 15)
+        raw = fetched.result()
 
-        if not suspicious_scan(raw):
+        data = _json_loads(raw)
+        if not scan_payload(data):
             return 0
 
-        data = json.loads(raw)
         posts = data.get("posts", data.get("results", []))
         if not isinstance(posts, list):
             return 0
@@ -199,43 +246,35 @@ def _pull_search(query: str, seen_ids: set, cycle: int, headers: dict) -> int:
     return 0
 
 
-def _fetch_nested_replies(comment: dict, headers: dict, depth: int = 1, max_depth: int = 3) -> dict:
-    """Recursively fetch nested replies up to max_depth."""
-    if depth >= max_depth:
-        return comment
-
-    replies = comment.get("replies", comment.get("children", []))
-    comment_id = comment.get("id")
-
-    # If reply_count suggests more replies exist but we don't have them, try fetching
-    reply_count = comment.get("reply_count", comment.get("replies_count", 0))
-    if comment_id and reply_count > len(replies):
-        try:
-            req = Request(
-                f"{API_BASE}/comments/{comment_id}/replies?limit=10",
-                headers=headers,
-            )
-            with urlopen(req, timeout=10) as resp:
-                rdata = json.loads(resp.read())
-            fetched = rdata.get("replies", rdata.get("comments", []))
-            if isinstance(fetched, list) and len(fetched) > len(replies):
-                replies = fetched
-        except (HTTPError, URLError, Exception):
-            pass  # keep whatever we already have
-
-    # Recurse into each reply
-    enriched_replies = []
-    for reply in replies:
-        if isinstance(reply, dict):
-            enriched_replies.append(
-                _fetch_nested_replies(reply, headers, depth + 1, max_depth)
-            )
-        else:
-            enriched_replies.append(reply)
-
-    if enriched_replies:
-        comment["replies"] = enriched_replies
-    return comment
+def _fetch_nested_replies(comments: list, headers: dict, max_depth: int = 3):
+    """Fill in nested replies in place, breadth-first, up to max_depth.
+    All missing reply lists on one level are fetched concurrently."""
+    level = [c for c in comments if isinstance(c, dict)]
+    for _ in range(1, max_depth):
+        pending = []
+        for comment in level:
+            replies = comment.get("replies", comment.get("children", []))
+            comment_id = comment.get("id")
+            # If reply_count suggests more replies exist but we don't have them, try fetching
+            reply_count = comment.get("reply_count", comment.get("replies_count", 0))
+            fetch = None
+            if comment_id and reply_count > len(replies):
+                fetch = _prefetch(f"{API_BASE}/comments/{comment_id}/replies?limit=10", headers, 10)
+            pending.append((comment, replies, fetch))
+
+        level = []
+        for comment, replies, fetch in pending:
+            if fetch is not None:
+                try:
+                    rdata = _json_loads(fetch.result())
+                    fetched = rdata.get("replies", rdata.get("comments", []))
+                    if isinstance(fetched, list) and len(fetched) > len(replies):
+                        replies = fetched
+                except Exception:
+                    pass  # keep whatever we already have
+            if replies:
+                comment["replies"] = list(replies)
+            level.extend(r for r in replies if isinstance(r, dict))
 
 
 def _store_posts(posts: list, seen_ids: set, cycle: int, label: str, headers: dict) -> int:
@@ -243,34 +282,34 @@ def _store_posts(posts: list, seen_ids: set, cycle: int, label: str, headers: di
     timestamp = int(time.time())
     new_count = 0
 
+    # Start every comment fetch for this batch's new posts before storing any
+    new_ids = list(dict.fromkeys(
+        pid for pid in (post.get("id", "unknown") for post in posts) if pid not in seen_ids
+    ))
+    comment_fetches = iter([
+        _prefetch(f"{API_BASE}/posts/{pid}/comments?sort=top&limit=20", headers, 15)
+        for pid in new_ids
+    ])
+
     for post in posts:
         post_id = post.get("id", "unknown")
         if post_id in seen_ids:
             continue
         seen_ids.add(post_id)
         new_count += 1
-        store_record(post, f"post_{timestamp}_{post_id[:8]}.json")
+        post_file = f"post_{timestamp}_{post_id[:8]}.json"
+        store_record(post, post_file)
+        queue_for_extraction(post_file)
 
         # Grab comments for conversational data
+        comment_fetch = next(comment_fetches)
         try:
-            comment_req = Request(
-                f"{API_BASE}/posts/{post_id}/comments?sort=top&limit=20",
-                headers=headers,
-            )
-            with urlopen(comment_req, timeout=15) as cresp:
-                craw = cresp.read()
-            if suspicious_scan(craw):
-                cdata = json.loads(craw)
-                comments = cdata.get("comments", [])
+            craw = comment_fetch.result()
+            cdata = _json_loads(craw)
+            if scan_payload(cdata):
+                enriched = list(cdata.get("comments", []))
                 # Fetch nested replies up to depth 3
-                enriched = []
-                for comment in comments:
-                    if isinstance(comment, dict):
-                        enriched.append(
-                            _fetch_nested_replies(comment, headers, depth=1, max_depth=3)
-                        )
-                    else:
-                        enriched.append(comment)
+                _fetch_nested_replies(enriched, headers, max_depth=3)
                 store_record(
                     {"post_id": post_id, "comments": enriched},
                     f"comments_{timestamp}_{post_id[:8]}.json",
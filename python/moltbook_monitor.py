@@ -7,11 +7,17 @@ Designed to run from cron every 30 minutes.
 """
 
 import json
+import os
 import subprocess
 import time
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import psutil
+except ImportError:  # /proc, or pgrep where there is no /proc
+    psutil = None
+
 # Paths
 STATUS_FILE = Path.home() / ".config" / "observer" / "status.json"
 RAW_DIR = Path.home() / ".config" / "observer" / "raw"
@@ -25,34 +31,129 @@ FINANCIAL_CONVERTER_LOG = Path.home() / "sovereignlabs" / "sovereign-financial-d
 FINANCIAL_DOJO_DIR = Path.home() / ".config" / "observer" / "scenarios" / "financial_dojo"
 
 
+def tail_lines(path: Path, n: int = 50, block: int = 8192) -> list[str]:
+    """The last ``n`` lines of ``path.read_text().strip().split("\n")``,
+    reading backwards from the end only as far as those lines reach."""
+    with path.open("rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        while pos > 0:
+            step = min(block, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            if pos and buf.count(b"\n") > n:
+                # Drop the first, possibly partial, line before decoding
+                lines = _text(buf[buf.index(b"\n") + 1:]).rstrip().split("\n")
+                # Done once a non-blank line precedes the last n: then neither
+                # end of the strip can reach further back than the buffer
+                if any(line.strip() for line in lines[:-n]):
+                    return lines[-n:]
+    return _text(buf).strip().split("\n")[-n:]
+
+
+def _text(data: bytes) -> str:
+    """Decode like read_text, including its newline translation."""
+    return data.decode().replace("\r\n", "\n").replace("\r", "\n")
+
+
+def last_error_line(lines: list[str]) -> str | None:
+    """The last line mentioning an error or traceback, if any."""
+    for line in reversed(lines):
+        lowered = line.lower()
+        if "error" in lowered or "traceback" in lowered:
+            return line
+    return None
+
+
+BRIDGE_MARKERS = ("moltbook_bridge.py", "world_data_bridge.py")
+
+
+def _scan_bridges() -> dict[str, int | None]:
+    """Lowest pid per BRIDGE_MARKERS entry, from one walk of the process table."""
+    found: dict[str, int | None] = dict.fromkeys(BRIDGE_MARKERS)
+    me = os.getpid()
+    if psutil is not None:
+        for proc in psutil.process_iter(["pid", "cmdline"]):
+            if proc.info["pid"] == me:
+                continue
+            cmdline = " ".join(proc.info["cmdline"] or ())
+            for marker in BRIDGE_MARKERS:
+                if found[marker] is None and marker in cmdline:
+                    found[marker] = proc.info["pid"]
+        return found
+    if os.path.isdir("/proc"):
+        needles = tuple((marker, marker.encode()) for marker in BRIDGE_MARKERS)
+        with os.scandir("/proc") as it:
+            pids = sorted(int(e.name) for e in it if e.name.isdigit())
+        for pid in pids:
+            if pid == me:
+                continue
+            try:
+                with open(f"/proc/{pid}/cmdline", "rb") as f:
+                    cmdline = f.read().replace(b"\0", b" ")
+            except OSError:
+                continue  # exited, or not ours to read
+            for marker, needle in needles:
+                if found[marker] is None and needle in cmdline:
+                    found[marker] = pid
+            if None not in found.values():
+                break
+        return found
+    # No /proc (macOS): one ps listing instead of a pgrep per bridge
+    result = subprocess.run(
+        ["ps", "-axo", "pid=,command="],
+        capture_output=True, text=True, timeout=5
+    )
+    for line in result.stdout.splitlines():
+        pid, _, cmdline = line.strip().partition(" ")
+        if not pid.isdigit() or int(pid) == me:
+            continue
+        for marker in BRIDGE_MARKERS:
+            if marker in cmdline and (found[marker] is None or int(pid) < found[marker]):
+                found[marker] = int(pid)
+    return found
+
+
+def scan_bridges() -> dict[str, int | None]:
+    """_scan_bridges(), reporting every bridge as down if the scan fails."""
+    try:
+        return _scan_bridges()
+    except Exception:
+        return dict.fromkeys(BRIDGE_MARKERS)
+
+
 def check_bridge_running() -> tuple[bool, int | None]:
     """Check if moltbook_bridge.py is running. Returns (running, pid)."""
+    pid = scan_bridges()["moltbook_bridge.py"]
+    return pid is not None, pid
+
+
+def newest_json_mtime(directory: Path, skip_private: bool = False) -> float | None:
+    """Newest st_mtime among ``directory``'s *.json files, or None if there are none.
+    One scandir; DirEntry carries the file type, so only matches get a stat()."""
+    newest = None
     try:
-        result = subprocess.run(
-            ["pgrep", "-f", "moltbook_bridge.py"],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            pids = result.stdout.strip().split("\n")
-            # Filter out our own process and grep itself
-            real_pids = [int(p) for p in pids if p.strip()]
-            if real_pids:
-                return True, real_pids[0]
-        return False, None
-    except Exception:
-        return False, None
+        with os.scandir(directory) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(".json") or name.startswith("."):
+                    continue
+                if skip_private and name.startswith("_"):
+                    continue
+                mtime = entry.stat().st_mtime
+                if newest is None or mtime > newest:
+                    newest = mtime
+    except FileNotFoundError:
+        return None
+    return newest
 
 
 def check_raw_data_freshness() -> tuple[bool, float]:
     """Check if raw data dir has been modified in the last 2 hours."""
-    if not RAW_DIR.exists():
-        return False, -1
-
-    files = list(RAW_DIR.glob("*.json"))
-    if not files:
+    newest = newest_json_mtime(RAW_DIR)
+    if newest is None:
         return False, -1
-
-    newest = max(f.stat().st_mtime for f in files)
     age_hours = (time.time() - newest) / 3600
     return age_hours < 2.0, round(age_hours, 2)
 
@@ -63,13 +164,10 @@ def check_converter_errors() -> tuple[bool, str]:
         return True, "no log file"
 
     try:
-        text = CONVERTER_LOG.read_text()
-        lines = text.strip().split("\n")
         # Check last 50 lines for errors
-        recent = lines[-50:] if len(lines) > 50 else lines
-        errors = [l for l in recent if "error" in l.lower() or "traceback" in l.lower()]
-        if errors:
-            return False, errors[-1][:200]
+        error = last_error_line(tail_lines(CONVERTER_LOG, 50))
+        if error is not None:
+            return False, error[:200]
         return True, "ok"
     except Exception as e:
         return False, str(e)[:200]
@@ -80,12 +178,9 @@ def check_financial_converter_errors() -> tuple[bool, str]:
     if not FINANCIAL_CONVERTER_LOG.exists():
         return True, "no log file"
     try:
-        text = FINANCIAL_CONVERTER_LOG.read_text()
-        lines = text.strip().split("\n")
-        recent = lines[-50:] if len(lines) > 50 else lines
-        errors = [l for l in recent if "error" in l.lower() or "traceback" in l.lower()]
-        if errors:
-            return False, errors[-1][:200]
+        error = last_error_line(tail_lines(FINANCIAL_CONVERTER_LOG, 50))
+        if error is not None:
+            return False, error[:200]
         return True, "ok"
     except Exception as e:
         return False, str(e)[:200]
@@ -93,32 +188,17 @@ def check_financial_converter_errors() -> tuple[bool, str]:
 
 def check_financial_dojo_freshness() -> tuple[bool, float]:
     """Check if financial_dojo output has been updated within 4 hours."""
-    if not FINANCIAL_DOJO_DIR.exists():
+    newest = newest_json_mtime(FINANCIAL_DOJO_DIR, skip_private=True)  # skip _conversion_stats.json
+    if newest is None:
         return False, -1
-    files = list(FINANCIAL_DOJO_DIR.glob("*.json"))
-    files = [f for f in files if not f.name.startswith("_")]  # skip _conversion_stats.json
-    if not files:
-        return False, -1
-    newest = max(f.stat().st_mtime for f in files)
     age_hours = (time.time() - newest) / 3600
     return age_hours < 4.0, round(age_hours, 2)
 
 
 def check_world_bridge_running() -> tuple[bool, int | None]:
     """Check if world_data_bridge.py is running. Returns (running, pid)."""
-    try:
-        result = subprocess.run(
-            ["pgrep", "-f", "world_data_bridge.py"],
-            capture_output=True, text=True, timeout=5
-        )
-        if result.returncode == 0:
-            pids = result.stdout.strip().split("\n")
-            real_pids = [int(p) for p in pids if p.strip()]
-            if real_pids:
-                return True, real_pids[0]
-        return False, None
-    except Exception:
-        return False, None
+    pid = scan_bridges()["world_data_bridge.py"]
+    return pid is not None, pid
 
 
 def restart_bridge():
@@ -155,8 +235,11 @@ def run_monitor():
     """Run all health checks and write status."""
     now = datetime.now(tz=__import__('datetime').timezone.utc).isoformat()
 
-    bridge_running, bridge_pid = check_bridge_running()
-    world_bridge_running, world_bridge_pid = check_world_bridge_running()
+    bridge_pids = scan_bridges()
+    bridge_pid = bridge_pids["moltbook_bridge.py"]
+    world_bridge_pid = bridge_pids["world_data_bridge.py"]
+    bridge_running = bridge_pid is not None
+    world_bridge_running = world_bridge_pid is not None
     data_fresh, data_age_hours = check_raw_data_freshness()
     converter_ok, converter_msg = check_converter_errors()
     fin_converter_ok, fin_converter_msg = check_financial_converter_errors()
@@ -199,9 +282,15 @@ def run_monitor():
     else:
         status["health"] = "degraded"
 
-    # Write status.json
+    # Write status.json via a temp file + rename, so readers never see a torn
+    # file; fsync first so a crash can't leave the rename pointing at empty data
     STATUS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    STATUS_FILE.write_text(json.dumps(status, indent=2))
+    tmp = STATUS_FILE.with_suffix(".json.tmp")
+    with open(tmp, "w") as f:
+        f.write(json.dumps(status, indent=2))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, STATUS_FILE)
 
     # Append one-liner to monitor.log
     one_liner = f"[{now}] health={status['health']} moltbook={'up' if bridge_running else 'down'} world={'up' if world_bridge_running else 'down'} data_age={data_age_hours}h converter={converter_msg[:40]} fin_converter={fin_converter_msg[:30]} fin_dojo_age={fin_dojo_age_hours}h"
@@ -209,8 +298,9 @@ def run_monitor():
         one_liner += " MOLTBOOK_RESTARTED"
     if world_restarted:
         one_liner += " WORLD_RESTARTED"
-    with open(str(MONITOR_LOG), "a") as f:
-        f.write(one_liner + "\n")
+    # One unbuffered write, so concurrent runs never interleave within a line
+    with open(MONITOR_LOG, "ab", buffering=0) as f:
+        f.write(one_liner.encode() + b"\n")
 
     print(one_liner)
     return status
@@ -14,20 +14,46 @@ Output:
 
 import json
 import hashlib
+import mmap
+import os
 import re
 import uuid
+from contextlib import ExitStack
+from itertools import repeat
 from pathlib import Path
 from datetime import datetime, timezone
 
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
+
+from dojo_files import list_files, write_file
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback — same data, just slower
+    orjson = None
+
 # ==================== PATHS ====================
 RAW_DIR = Path.home() / ".config" / "observer" / "raw"
 AGENT_DOJO_DIR = Path.home() / ".config" / "observer" / "scenarios" / "agent_dojo"
 GUARDIAN_DOJO_DIR = Path.home() / ".config" / "observer" / "scenarios" / "guardian_dojo"
 PROCESSED_LOG = Path.home() / ".config" / "observer" / "processed.json"
+RAW_INDEX = Path.home() / ".config" / "observer" / "processed_files.json"
+# One compact line per guardian scenario file with just what show_stats needs
+GUARDIAN_STATS_INDEX = Path.home() / ".config" / "observer" / "guardian_stats.ndjson"
 
 AGENT_DOJO_DIR.mkdir(parents=True, exist_ok=True)
 GUARDIAN_DOJO_DIR.mkdir(parents=True, exist_ok=True)
 
+# Signal scanning and JSON encoding are CPU-bound, so large backlogs fan out
+# across processes. Below PARALLEL_MIN_POSTS, worker startup costs more than it saves.
+CONVERT_WORKERS = os.cpu_count() or 1
+PARALLEL_MIN_POSTS = 2000
+# Raw files at least this big are memory-mapped rather than read into bytes
+MMAP_MIN_BYTES = 256 * 1024
+
 # ==================== BEHAVIORAL SIGNAL DETECTORS ====================
 #
 # These detect bot-on-bot social dynamics, not just keywords.
@@ -128,36 +154,152 @@ BENIGN_SIGNALS = [
     r"\b(has anyone (tried|used|seen|experienced))\b",
 ]
 
+MANIPULATION_SIGNALS = {
+    category: [re.compile(p) for p in patterns]
+    for category, patterns in MANIPULATION_SIGNALS.items()
+}
+BENIGN_SIGNALS = [re.compile(p) for p in BENIGN_SIGNALS]
+
+
+def _match_starts(items) -> tuple[str, ...] | None:
+    """Literals one of which every match of a parsed regex starts with.
+    Returns None when a match can start some other way."""
+    if not items:
+        return None
+    op, av = items[0]
+    if op is sre_parse.LITERAL:
+        run = []
+        for op, av in items:
+            if op is not sre_parse.LITERAL:
+                break
+            run.append(chr(av))
+        return ("".join(run),)
+    if op is sre_parse.SUBPATTERN:
+        return _match_starts(av[-1])
+    if op is sre_parse.BRANCH:
+        alternatives = [_match_starts(alt) for alt in av[1]]
+        if all(alternatives):
+            return tuple(lit for alt in alternatives for lit in alt)
+    return None
+
+
+# Most signals open with a word alternation, which leaves sre trying a match at
+# every char that could begin one of the words. When every opening word is at
+# least 3 chars, str.find jumps straight to them instead. A single opening
+# literal is left to sre, whose own prefix scan beats repeated str.find.
+SIGNAL_STARTS = {}
+# detect_signals keeps matches longer than 3 chars, so shorter text can't signal
+MIN_SIGNAL_LEN = None
+for _patterns in MANIPULATION_SIGNALS.values():
+    for _pattern in _patterns:
+        _parsed = sre_parse.parse(_pattern.pattern)  # parse once for both tables
+        _starts = _match_starts(_parsed)
+        if _starts and len(_starts) > 1 and min(map(len, _starts)) >= 3:
+            SIGNAL_STARTS[_pattern] = _starts
+        _width = max(4, _parsed.getwidth()[0])
+        if MIN_SIGNAL_LEN is None or _width < MIN_SIGNAL_LEN:
+            MIN_SIGNAL_LEN = _width
+
+
+def _find_signal(pattern: re.Pattern, text: str):
+    """Same matches as pattern.finditer(text)."""
+    starts = SIGNAL_STARTS.get(pattern)
+    if starts is None:
+        yield from pattern.finditer(text)
+        return
+    positions = set()
+    for literal in starts:
+        i = text.find(literal)
+        while i != -1:
+            positions.add(i)
+            i = text.find(literal, i + 1)
+    end = 0
+    for pos in sorted(positions):
+        if pos >= end and (m := pattern.match(text, pos)):
+            yield m
+            end = m.end()
+
+
+# detect_signals results by content digest: reposted spam and overlapping reply
+# chains repeat thread text verbatim. Cleared wholesale once full.
+_SIGNAL_CACHE: dict[bytes, dict] = {}
+SIGNAL_CACHE_MAX = 50_000
+
 
 def detect_signals(text: str) -> dict:
-    """Detect behavioral signals in text. Returns signal categories with matched phrases."""
+    """Detect behavioral signals in text. Returns signal categories with matched phrases.
+    Results are memoized, so callers must not mutate the returned dict."""
+    # lower() can lengthen a few characters, hence the second check
+    if len(text) < MIN_SIGNAL_LEN and len(text.lower()) < MIN_SIGNAL_LEN:
+        return {}
+    key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    cached = _SIGNAL_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    # One lower() feeding case-sensitive str patterns beats re.IGNORECASE (~5x
+    # slower) and bytes patterns (the encode costs more than it saves), and
+    # keeps the recorded matches lowercase.
     text_lower = text.lower()
     detected = {}
     for category, patterns in MANIPULATION_SIGNALS.items():
         matches = []
         for pattern in patterns:
             # Use finditer to get actual matched text, not just groups
-            for m in re.finditer(pattern, text_lower):
+            for m in _find_signal(pattern, text_lower):
                 matched_text = m.group(0)
                 if matched_text and len(matched_text) > 3:
                     matches.append(matched_text)
         if matches:
             # Deduplicate
             detected[category] = list(dict.fromkeys(matches))
+
+    if len(_SIGNAL_CACHE) >= SIGNAL_CACHE_MAX:
+        _SIGNAL_CACHE.clear()
+    _SIGNAL_CACHE[key] = detected
     return detected
 
 
 def is_benign(text: str) -> bool:
     """Check if text is mostly benign conversation."""
     text_lower = text.lower()
-    benign_count = sum(1 for p in BENIGN_SIGNALS if re.search(p, text_lower))
-    manipulation_count = sum(
-        1 for patterns in MANIPULATION_SIGNALS.values()
-        for p in patterns if re.search(p, text_lower)
-    )
+    benign_count = sum(1 for p in BENIGN_SIGNALS if p.search(text_lower))
+    # Stop scanning once the manipulation patterns have drawn level
+    manipulation_count = 0
+    for patterns in MANIPULATION_SIGNALS.values():
+        for p in patterns:
+            if manipulation_count >= benign_count:
+                return False
+            if p.search(text_lower):
+                manipulation_count += 1
     return benign_count > manipulation_count
 
 
+def _category_scores(w: float) -> tuple:
+    """A category's score after 0, 1, 2 and 3+ matches.
+    Diminishing returns: 1st match full weight, 2nd half, 3rd quarter."""
+    scores = [0]
+    for i in range(3):
+        scores.append(scores[-1] + w / (2 ** i))
+    return tuple(scores)
+
+
+# Per-category weight: how much does one match in this category contribute?
+CATEGORY_WEIGHTS = {
+    "trust_building": 0.10,
+    "urgency_pressure": 0.15,
+    "authority_claim": 0.15,
+    "information_extraction": 0.25,
+    "deception": 0.20,
+    "resource_solicitation": 0.20,
+    "code_injection": 0.30,
+    "social_dominance": 0.10,
+    "reputation_gaming": 0.10,
+}
+CATEGORY_SCORES = {cat: _category_scores(w) for cat, w in CATEGORY_WEIGHTS.items()}
+DEFAULT_CATEGORY_SCORES = _category_scores(0.1)
+
+
 def compute_threat_score(signals: dict) -> float:
     """0.0 (benign) to 1.0 (highly manipulative).
     Scoring requires MULTIPLE signal categories to reach high scores.
@@ -165,30 +307,11 @@ def compute_threat_score(signals: dict) -> float:
     if not signals:
         return 0.0
 
-    # Per-category weight: how much does one match in this category contribute?
-    weights = {
-        "trust_building": 0.10,
-        "urgency_pressure": 0.15,
-        "authority_claim": 0.15,
-        "information_extraction": 0.25,
-        "deception": 0.20,
-        "resource_solicitation": 0.20,
-        "code_injection": 0.30,
-        "social_dominance": 0.10,
-        "reputation_gaming": 0.10,
-    }
-
     # Base score: sum of (weight * match_count), capped per category
-    category_scores = {}
-    for cat, matches in signals.items():
-        w = weights.get(cat, 0.1)
-        # Diminishing returns: 1st match full weight, 2nd half, 3rd quarter
-        cat_score = 0
-        for i, _ in enumerate(matches[:3]):
-            cat_score += w / (2 ** i)
-        category_scores[cat] = cat_score
-
-    raw_score = sum(category_scores.values())
+    raw_score = sum(
+        CATEGORY_SCORES.get(cat, DEFAULT_CATEGORY_SCORES)[min(len(matches), 3)]
+        for cat, matches in signals.items()
+    )
 
     # Diversity bonus: multiple categories = more likely real manipulation
     n_categories = len(signals)
@@ -249,20 +372,27 @@ def extract_threads(post: dict, comments_data: dict | None) -> list[list[str]]:
 
     # Flat thread: post + all top-level replies (including nested)
     thread = [post_content]
+    reply_spans = []  # where each comment's nested replies sit in the flat thread
     for comment in comments[:10]:  # cap at 10 for sanity
         body = comment.get("content", comment.get("body", ""))
         if body:
             thread.append(body)
         # Collect nested replies into the flat thread too
+        start = len(thread)
         _collect_reply_chain(comment, thread, depth=0, max_depth=3)
+        reply_spans.append((start, len(thread)))
     threads.append(thread)
 
     # Also extract deep reply chains as separate threads
-    for comment in comments:
+    for i, comment in enumerate(comments):
         replies = comment.get("replies", comment.get("children", []))
         if replies and isinstance(replies, list) and len(replies) >= 1:
             chain = [comment.get("content", comment.get("body", ""))]
-            _collect_reply_chain(comment, chain, depth=0, max_depth=3)
+            if i < len(reply_spans):
+                start, end = reply_spans[i]
+                chain.extend(thread[start:end])  # already walked for the flat thread
+            else:
+                _collect_reply_chain(comment, chain, depth=0, max_depth=3)
             if len(chain) >= 3:
                 threads.append(chain)
 
@@ -339,8 +469,10 @@ def _submolt_name(post: dict) -> str:
 
 # ==================== GUARDIAN DOJO CONVERTER ====================
 
-def to_guardian_dojo_scenario(thread: list[str], signals: dict, post: dict) -> dict | None:
+def to_guardian_dojo_scenario(thread: list[str], signals: dict, post: dict,
+                              full_text: str | None = None) -> dict | None:
     """Convert a Moltbook thread to Guardian Dojo scenario format.
+    ``full_text`` is the thread already joined with spaces, if the caller has it.
 
     Guardian Dojo scenarios need:
       - scenarioType: grooming | bullying | socialEngineering | phishing | etc.
@@ -416,7 +548,7 @@ def to_guardian_dojo_scenario(thread: list[str], signals: dict, post: dict) -> d
             "scenarioType": scenario_type,
             "profileType": "child",  # default; could vary
             "platform": "Moltbook",
-            "threatContent": " ".join(thread),
+            "threatContent": " ".join(thread) if full_text is None else full_text,
             "senderInfo": {
                 "displayName": agent_name,
                 "accountAge": "unknown",
@@ -443,39 +575,145 @@ def to_guardian_dojo_scenario(thread: list[str], signals: dict, post: dict) -> d
     }
 
 
+# ==================== JSON ====================
+
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_json(path):
+    """Parse a JSON file. Big files are memory-mapped straight into orjson,
+    skipping the copy into a bytes object; below MMAP_MIN_BYTES, mapping costs more."""
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+        return _json_loads(f.read())
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+def _json_compact(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _replace_file(path: Path, data: bytes):
+    """Write via a temp file + rename, so a crash mid-write never leaves a torn file."""
+    tmp = path.with_suffix(".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def _json_line(obj) -> bytes:
+    """Serialize to one compact, newline-terminated JSON line."""
+    return _json_compact(obj) + b"\n"
+
+
 # ==================== BATCH CONVERTER ====================
 
 def load_processed() -> set:
     """Load set of already-processed post IDs."""
-    if PROCESSED_LOG.exists():
-        return set(json.loads(PROCESSED_LOG.read_text()))
-    return set()
+    try:
+        return set(_load_json(PROCESSED_LOG))
+    except FileNotFoundError:
+        return set()
 
 
 def save_processed(ids: set):
-    PROCESSED_LOG.write_text(json.dumps(sorted(ids)))
+    _replace_file(PROCESSED_LOG, _json_compact(sorted(ids)))
+
+
+def load_raw_index() -> dict:
+    """Raw file name -> [mtime_ns, post id], as seen on the previous run."""
+    try:
+        return _load_json(RAW_INDEX)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def read_unprocessed(prefix: str, id_key: str, default: str | None,
+                     processed: set, index: dict, seen: dict) -> list[tuple]:
+    """(post id, record) for each RAW_DIR/prefix*.json whose post isn't processed, in name order.
+    A file still in ``index`` with the same mtime is skipped unparsed if its post is
+    processed. Every file's entry lands in ``seen`` for the next run's index.
+    ``default`` is the id for records missing ``id_key``; None means the file stem."""
+    try:
+        with os.scandir(RAW_DIR) as it:
+            entries = sorted(
+                (e for e in it if e.name.startswith(prefix) and e.name.endswith(".json")),
+                key=lambda e: e.name,
+            )
+    except FileNotFoundError:
+        return []
+
+    records = []
+    for entry in entries:
+        mtime = entry.stat().st_mtime_ns
+        known = index.get(entry.name)
+        if known is not None and known[0] == mtime and known[1] in processed:
+            seen[entry.name] = known
+            continue
+        data = _load_json(entry.path)
+        pid = data.get(id_key, os.path.splitext(entry.name)[0] if default is None else default)
+        seen[entry.name] = [mtime, pid]
+        if pid not in processed:
+            records.append((pid, data))
+    return records
+
+
+def save_raw_index(seen: dict):
+    _replace_file(RAW_INDEX, _json_compact(seen))
+
+
+def convert_post(pid: str, post: dict, comment_data: dict | None, ts: int) -> tuple[list, list]:
+    """Build one post's agent and guardian scenarios as (filename, JSON bytes) pairs.
+    Touches no files, so it can run in a worker process."""
+    agent_files = []
+    guardian_files = []
+    threads = extract_threads(post, comment_data)
+
+    for i, thread in enumerate(threads):
+        full_text = " ".join(thread)
+        signals = detect_signals(full_text)
+        fname = f"moltbook_{ts}_{pid[:8]}_{i}.json"
+
+        # Agent Dojo
+        agent_scenario = to_agent_dojo_scenario(thread, signals, post)
+        if agent_scenario:
+            agent_files.append((fname, _json_dumps(agent_scenario)))
+
+        # Guardian Dojo
+        guardian_scenario = to_guardian_dojo_scenario(thread, signals, post, full_text)
+        if guardian_scenario:
+            guardian_files.append((fname, _json_dumps(guardian_scenario)))
+
+    return agent_files, guardian_files
 
 
 def convert_all():
     """Scan raw dir, convert new posts+comments to dojo scenarios."""
     processed = load_processed()
+    index = load_raw_index()
+    seen = {}
 
-    # Group posts and their comments
-    posts = {}
-    comments = {}
-
-    for f in sorted(RAW_DIR.glob("post_*.json")):
-        data = json.loads(f.read_text())
-        pid = data.get("id", f.stem)
-        if pid not in processed:
-            posts[pid] = data
-
-    for f in sorted(RAW_DIR.glob("comments_*.json")):
-        data = json.loads(f.read_text())
-        pid = data.get("post_id", "unknown")
-        comments[pid] = data
+    # Group posts and their comments; only unprocessed posts' comments are ever used
+    posts = dict(read_unprocessed("post_", "id", None, processed, index, seen))
+    comments = dict(read_unprocessed("comments_", "post_id", "unknown", processed, index, seen))
 
     if not posts:
+        if seen != index:
+            save_raw_index(seen)
         print("No new posts to convert.")
         return
 
@@ -483,41 +721,88 @@ def convert_all():
     guardian_count = 0
     ts = int(datetime.now(timezone.utc).timestamp())
 
-    for pid, post in posts.items():
-        comment_data = comments.get(pid)
-        threads = extract_threads(post, comment_data)
+    pids = list(posts)
+    post_list = list(posts.values())
+    comment_list = [comments.get(pid) for pid in pids]
+    agent_dir = str(AGENT_DOJO_DIR)
+    guardian_dir = str(GUARDIAN_DOJO_DIR)
+    with ExitStack() as stack:
+        if CONVERT_WORKERS > 1 and len(pids) >= PARALLEL_MIN_POSTS:
+            # Imported here: multiprocessing dominates startup for small runs
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(max_workers=CONVERT_WORKERS)
+            # On an error below, don't wait for the remaining posts to convert
+            stack.callback(pool.shutdown, cancel_futures=True)
+            results = pool.map(convert_post, pids, post_list, comment_list, repeat(ts), chunksize=16)
+        else:
+            results = map(convert_post, pids, post_list, comment_list, repeat(ts))
+
+        # Only the main process writes, in post order, while workers convert the rest
+        for pid, (agent_files, guardian_files) in zip(pids, results):
+            for fname, data in agent_files:
+                write_file(os.path.join(agent_dir, fname), data)
+            for fname, data in guardian_files:
+                write_file(os.path.join(guardian_dir, fname), data)
+            agent_count += len(agent_files)
+            guardian_count += len(guardian_files)
+            processed.add(pid)
 
-        for i, thread in enumerate(threads):
-            full_text = " ".join(thread)
-            signals = detect_signals(full_text)
+    save_processed(processed)
+    save_raw_index(seen)
+    print(f"Converted {len(posts)} posts → {agent_count} agent dojo + {guardian_count} guardian dojo scenarios")
 
-            # Agent Dojo
-            agent_scenario = to_agent_dojo_scenario(thread, signals, post)
-            if agent_scenario:
-                fname = f"moltbook_{ts}_{pid[:8]}_{i}.json"
-                (AGENT_DOJO_DIR / fname).write_text(json.dumps(agent_scenario, indent=2))
-                agent_count += 1
 
-            # Guardian Dojo
-            guardian_scenario = to_guardian_dojo_scenario(thread, signals, post)
-            if guardian_scenario:
-                fname = f"moltbook_{ts}_{pid[:8]}_{i}.json"
-                (GUARDIAN_DOJO_DIR / fname).write_text(json.dumps(guardian_scenario, indent=2))
-                guardian_count += 1
+# ==================== STATS ====================
 
-        processed.add(pid)
+def guardian_stats_entry(name: str, scenario: dict) -> dict:
+    """The GUARDIAN_STATS_INDEX line for one guardian scenario file."""
+    is_threat = bool(scenario.get("context", {}).get("groundTruth", {}).get("isThreat"))
+    return {
+        "file": name,
+        "isThreat": is_threat,
+        "scenarioType": scenario["context"]["scenarioType"] if is_threat else None,
+    }
 
-    save_processed(processed)
-    print(f"Converted {len(posts)} posts → {agent_count} agent dojo + {guardian_count} guardian dojo scenarios")
 
+def load_guardian_stats(paths: list[str]) -> list[dict]:
+    """Index entries for the given guardian files, in order. Only files the index
+    hasn't seen are parsed; the index is then brought in step with ``paths``."""
+    index = {}
+    torn = False
+    try:
+        for line in GUARDIAN_STATS_INDEX.read_bytes().splitlines():
+            if line:
+                entry = _json_loads(line)
+                index[entry["file"]] = entry
+    except FileNotFoundError:
+        pass
+    except ValueError:
+        index, torn = {}, True  # rebuild from the files
+
+    names = [os.path.basename(path) for path in paths]
+    new = [
+        guardian_stats_entry(name, _load_json(path))
+        for name, path in zip(names, paths) if name not in index
+    ]
+    entries = [index.get(name) for name in names]
+    if new:
+        fresh = iter(new)
+        entries = [entry or next(fresh) for entry in entries]
+
+    if torn or len(index) > len(entries) - len(new):
+        # Torn, or scenario files were removed: rewrite the index
+        _replace_file(GUARDIAN_STATS_INDEX, b"".join(_json_line(entry) for entry in entries))
+    elif new:
+        with GUARDIAN_STATS_INDEX.open("ab") as f:
+            f.write(b"".join(_json_line(entry) for entry in new))
+    return entries
 
-# ==================== STATS ====================
 
 def show_stats():
     """Show conversion stats."""
-    agent_files = list(AGENT_DOJO_DIR.glob("moltbook_*.json"))
-    guardian_files = list(GUARDIAN_DOJO_DIR.glob("moltbook_*.json"))
-    raw_files = list(RAW_DIR.glob("post_*.json"))
+    agent_files = list_files(AGENT_DOJO_DIR, "moltbook_", ".json")
+    guardian_files = list_files(GUARDIAN_DOJO_DIR, "moltbook_", ".json")
+    raw_files = list_files(RAW_DIR, "post_", ".json")
     processed = load_processed()
 
     print(f"Raw posts:            {len(raw_files)}")
@@ -531,12 +816,10 @@ def show_stats():
         threat_count = 0
         benign_count = 0
         type_counts = {}
-        for f in guardian_files:
-            s = json.loads(f.read_text())
-            gt = s.get("context", {}).get("groundTruth", {})
-            if gt.get("isThreat"):
+        for entry in load_guardian_stats(guardian_files):
+            if entry["isThreat"]:
                 threat_count += 1
-                st = s["context"]["scenarioType"]
+                st = entry["scenarioType"]
                 type_counts[st] = type_counts.get(st, 0) + 1
             else:
                 benign_count += 1
@@ -12,21 +12,44 @@ Ghost fetches → Suspicious scans every byte → only sanitised patterns reach
 100% on-device. Revocable by single C' tap. The tool never becomes the master.
 """
 
+import csv
+import gzip
 import json
+import os
 import re
 import sys
 import time
 import random
 import hashlib
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from html.parser import HTMLParser
+from itertools import islice
 from pathlib import Path
-from urllib.request import Request, urlopen
 from urllib.error import HTTPError, URLError
 
+from bridge_http import close_connections, http_get
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback — same data, just slower
+    orjson = None
+
 # ==================== CONFIG ====================
 DATA_DIR = Path.home() / ".config" / "observer" / "raw"
 DATA_DIR.mkdir(parents=True, exist_ok=True)
+# Append-only log of seen fingerprints, one integer per line
+SEEN_LOG = DATA_DIR.parent / "scam_seen.ndjson"
+SEEN_LEGACY = DATA_DIR.parent / "scam_seen.json"  # whole-list format, migrated on load
+SEEN_CAP = 10_000
+# ETag / Last-Modified per Scamwatch URL, for conditional GETs
+PAGE_VALIDATORS = DATA_DIR.parent / "scam_page_validators.json"
 
 # Polling: 6 hours base ± 1 hour jitter (these sources update daily, not every 30 min)
 POLL_BASE = 21600
@@ -57,6 +80,80 @@ def _log(*args):
     print(f"[{datetime.now(timezone.utc).isoformat()}]", *args, flush=True)
 
 
+# ==================== HTTP ====================
+# Connections (bridge_http) are kept alive for the length of a cycle: the
+# two Scamwatch pages share a TLS handshake instead of paying for one each.
+
+# Feed downloads started at the top of run_cycle, claimed by _fetch
+_PREFETCHED: dict[str, Future] = {}
+
+
+# The feeds and pages are plain text that compresses several-fold
+_REQUEST_HEADERS = {"User-Agent": USER_AGENT, "Accept-Encoding": "gzip"}
+
+
+def _response_body(body: bytes, headers, validators: dict | None) -> bytes:
+    """Inflate a gzip-encoded body and record the response's validators."""
+    if validators is not None:
+        for key, header in (("etag", "ETag"), ("last_modified", "Last-Modified")):
+            value = headers.get(header)
+            if value:
+                validators[key] = value
+            else:
+                validators.pop(key, None)
+    if headers.get("Content-Encoding") != "gzip":
+        return body
+    try:
+        return gzip.decompress(body)
+    except (OSError, EOFError, zlib.error) as e:
+        raise URLError(f"bad gzip body: {e}")
+
+
+def _http_get(url: str, timeout: float, validators: dict | None = None) -> bytes | None:
+    """GET url and return the body. Follows redirects and raises
+    HTTPError/URLError like urlopen.
+
+    ``validators`` holds the etag/last_modified of an earlier response:
+    the request is made conditional, None means 304 Not Modified, and a
+    full response refreshes the dict in place.
+    """
+    headers = _REQUEST_HEADERS
+    if validators:
+        headers = dict(headers)
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    status, resp_headers, body = http_get(url, headers, timeout)
+    if status == 304:
+        return None
+    return _response_body(body, resp_headers, validators)
+
+
+def _fetch(url: str, timeout: float, validators: dict | None = None) -> bytes | None:
+    """Body of url, from the cycle's background download if one was started."""
+    pending = _PREFETCHED.pop(url, None)
+    if pending is not None:
+        return pending.result()
+    return _http_get(url, timeout, validators)
+
+
+# ==================== JSON ====================
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
 # ==================== C' REVOCATION ====================
 def c_prime_kill():
     """One biometric tap → all cached data destroyed. No recovery."""
@@ -67,22 +164,79 @@ def c_prime_kill():
 
 
 # ==================== SUSPICIOUS SCAN ====================
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+EMAIL_LOCAL_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-"
+_WORD_BOUNDARY = re.compile(r'\b')
+
+# Applied in order: later patterns see earlier redactions
+# A leading \b stops re from skipping ahead to candidate characters, so it
+# checks every position. "\d(?<!\w\d)" is "\b\d" written to start on the
+# digit; "\+(?<=\w\+)" is "\b\+" likewise.
+PII_PATTERNS = [
+    # SSNs, credit card numbers, email addresses
+    (re.compile(r'\d(?<!\w\d)\d{2}-\d{2}-\d{4}\b'), '[REDACTED-SSN]'),
+    (re.compile(r'\d(?<!\w\d)\d{3}[- ]\d{4}[- ]\d{4}[- ]\d{4}\b'), '[REDACTED-CC]'),
+    (EMAIL_PATTERN, '[REDACTED-EMAIL]'),
+    # Australian phone numbers (04xx xxx xxx, +614xx xxx xxx)
+    (re.compile(r'(?:\+(?<=\w\+)61|6(?<!\w6)1|0(?<!\w0))4\d{2}[\s-]?\d{3}[\s-]?\d{3}\b'), '[REDACTED-PHONE]'),
+    # Any 10+ digit number sequences (potential account numbers)
+    (re.compile(r'\d(?<!\w\d)\d{9,}\b'), '[REDACTED-NUM]'),
+]
+
+
 def suspicious_scan(text: str) -> str:
     """Strip any real PII before storage. Returns sanitised text."""
-    # Remove SSNs, credit card numbers, phone numbers with area codes, email addresses
-    text = re.sub(r'\b\d{3}-\d{2}-\d{4}\b', '[REDACTED-SSN]', text)
-    text = re.sub(r'\b\d{4}[- ]\d{4}[- ]\d{4}[- ]\d{4}\b', '[REDACTED-CC]', text)
-    text = re.sub(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b', '[REDACTED-EMAIL]', text)
-    # Remove Australian phone numbers (04xx xxx xxx, +614xx xxx xxx)
-    text = re.sub(r'\b(?:\+?61|0)4\d{2}[\s-]?\d{3}[\s-]?\d{3}\b', '[REDACTED-PHONE]', text)
-    # Remove any 10+ digit number sequences (potential account numbers)
-    text = re.sub(r'\b\d{10,}\b', '[REDACTED-NUM]', text)
+    for pattern, replacement in PII_PATTERNS:
+        if pattern is EMAIL_PATTERN:
+            text = _redact_emails(text, replacement)
+        else:
+            text = pattern.sub(replacement, text)
     return text
 
 
+def _redact_emails(text: str, replacement: str) -> str:
+    """EMAIL_PATTERN.sub() in linear time.
+
+    re retries the local part from every word boundary inside a run of
+    [A-Za-z0-9._%+-], so a long run with no '@' after it (base64 blobs,
+    dotted paths, dashed digits) goes quadratic. The local part can only
+    end at an '@', so anchor on each '@' and try just the leftmost
+    boundary of the run in front of it — every later start would fail the
+    same way.
+    """
+    out = []
+    pos = 0
+    floor = 0  # runs never span an '@' or a previous match
+    at = text.find('@')
+    while at != -1:
+        run = text[floor:at]
+        start = at - (len(run) - len(run.rstrip(EMAIL_LOCAL_CHARS)))
+        boundary = _WORD_BOUNDARY.search(text, start, at)
+        if boundary and boundary.start() < at:
+            m = EMAIL_PATTERN.match(text, boundary.start())
+            if m:
+                out.append(text[pos:m.start()])
+                out.append(replacement)
+                pos = floor = m.end()
+                at = text.find('@', pos)
+                continue
+        floor = at + 1
+        at = text.find('@', floor)
+    if not out:
+        return text
+    out.append(text[pos:])
+    return "".join(out)
+
+
 # ==================== HTML PARSING ====================
 class ScamPageParser(HTMLParser):
-    """Extract text content from Scamwatch HTML pages, stripping tags."""
+    """Extract text content from Scamwatch HTML pages, stripping tags.
+
+    Pure Python, but only two pages go through it per cycle at ~10 ms per
+    100 KB, next to seconds of network and polite delay. A C parser would
+    also close unbalanced tags differently from the skip-depth counting
+    below, changing the text that gets scrubbed and stored.
+    """
 
     def __init__(self):
         super().__init__()
@@ -116,25 +270,60 @@ class ScamPageParser(HTMLParser):
         return "\n".join(self._text_parts)
 
 
+# Patterns for _extract_scam_examples
+QUOTED_EXAMPLE = re.compile(r'["""](.{20,300}?)["""]')
+# "(?:^|\n)\s*[•\-\*]\s*(.{20,500})" split in two, so the line pattern
+# starts on a literal "\n" that re can jump between
+BULLET_AT_START = re.compile(r'\s*[•\-\*]\s*(.{20,500})')
+BULLET_LINE = re.compile(r'\n\s*[•\-\*]\s*(.{20,500})')
+BULLET_KEYWORDS = ("scam", "fake", "fraud", "phish", "urgent", "click",
+                   "verify", "suspended", "account", "payment", "prize")
+if ahocorasick is not None:
+    _BULLET_AUTOMATON = ahocorasick.Automaton()
+    for _kw in BULLET_KEYWORDS:
+        _BULLET_AUTOMATON.add_word(_kw, _kw)
+    _BULLET_AUTOMATON.make_automaton()
+# Run on text.lower(), ~2.5x faster than IGNORECASE. The spans carry over
+# unless lower() changes the length (İ) or the text has ı/ſ, which
+# IGNORECASE folds to i/s; those pages take the caseless pattern.
+EXAMPLE_BLOCK = re.compile(r'(?:example|for instance|such as)[:\s]+(.{20,500})')
+EXAMPLE_BLOCK_CASELESS = re.compile(EXAMPLE_BLOCK.pattern, re.IGNORECASE)
+
+
+def _has_bullet_keyword(lowered: str) -> bool:
+    """True if any of BULLET_KEYWORDS occurs in the lowercased bullet.
+
+    Callers lowercase once and pass the result in. The automaton is
+    ~2.5x faster than the tuple scan on bullet-length strings.
+    """
+    if ahocorasick is not None:
+        return next(_BULLET_AUTOMATON.iter(lowered), None) is not None
+    return any(kw in lowered for kw in BULLET_KEYWORDS)
+
+
 def _extract_scam_examples(text: str) -> list[dict]:
     """Extract individual scam examples from page text.
     Looks for quoted examples, bullet points, and numbered lists."""
     examples = []
 
     # Quoted examples (often in blockquotes or with quotation marks)
-    quoted = re.findall(r'["""](.{20,300}?)["""]', text)
-    for q in quoted:
-        examples.append({"type": "quoted_example", "text": q.strip()})
+    for m in QUOTED_EXAMPLE.finditer(text):
+        examples.append({"type": "quoted_example", "text": m.group(1).strip()})
 
     # Bullet-style scam message patterns
-    bullets = re.findall(r'(?:^|\n)\s*[•\-\*]\s*(.{20,500})', text)
+    first = BULLET_AT_START.match(text)
+    bullets = [first.group(1)] if first else []
+    bullets += BULLET_LINE.findall(text, first.end() if first else 0)
     for b in bullets:
-        if any(kw in b.lower() for kw in ["scam", "fake", "fraud", "phish", "urgent", "click",
-                                            "verify", "suspended", "account", "payment", "prize"]):
+        if _has_bullet_keyword(b.lower()):
             examples.append({"type": "bullet_pattern", "text": b.strip()})
 
     # "Example:" or "For example" blocks
-    example_blocks = re.findall(r'(?:example|for instance|such as)[:\s]+(.{20,500})', text, re.IGNORECASE)
+    lowered = text.lower()
+    if len(lowered) == len(text) and "ı" not in text and "ſ" not in text:
+        example_blocks = [text[m.start(1):m.end(1)] for m in EXAMPLE_BLOCK.finditer(lowered)]
+    else:
+        example_blocks = EXAMPLE_BLOCK_CASELESS.findall(text)
     for eb in example_blocks:
         examples.append({"type": "example_block", "text": eb.strip()})
 
@@ -142,17 +331,75 @@ def _extract_scam_examples(text: str) -> list[dict]:
 
 
 # ==================== FETCHERS ====================
-def fetch_scamwatch(seen_hashes: set) -> int:
+def _feed_lines(raw: bytes):
+    """Lazily yield raw.decode("utf-8", errors="replace").strip().split("\n").
+
+    Feeds run to megabytes but are only read until an entry cap, so lines
+    are found with bytes.find and decoded one at a time; the body is never
+    decoded or stripped whole. Whether a line is the last non-blank one
+    (and so gets the trailing strip) is only known once a later line isn't
+    blank, so one line and any blank run after it are held back.
+    """
+    held = None
+    blanks = []
+    pos = 0
+    while pos <= len(raw):
+        end = raw.find(b"\n", pos)
+        if end == -1:
+            end = len(raw)
+        line = raw[pos:end].decode("utf-8", errors="replace")
+        pos = end + 1
+        if not line or line.isspace():
+            if held is not None:
+                blanks.append(line)
+        elif held is None:
+            held = line.lstrip()
+        else:
+            yield held
+            yield from blanks
+            blanks.clear()
+            held = line
+    yield "" if held is None else held.rstrip()
+
+
+def _fingerprint(data: bytes) -> int:
+    """64-bit dedupe key: the first 8 bytes of SHA-256, the same value the
+    old 16-char hex keys spelled out (int(key, 16)).
+
+    Stays SHA-256 on purpose: a cycle hashes at most ~600 short URLs
+    (~0.4 ms), and any other function would orphan every key already in
+    scam_seen.json and re-ingest the feeds once.
+    """
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+
+
+def fetch_scamwatch(seen_hashes: set, pages: list[tuple[str, str]] = SCAMWATCH_PAGES) -> int:
     """Fetch scam type pages from Scamwatch (Australian ACCC). Returns new record count."""
     new_count = 0
-    headers = {"User-Agent": USER_AGENT}
-
-    for url, category in SCAMWATCH_PAGES:
+    try:
+        validators = _json_loads(PAGE_VALIDATORS.read_bytes())
+    except (FileNotFoundError, ValueError):
+        validators = {}
+    before = dict(validators)
+
+    for i, (url, category) in enumerate(pages):
+        # Polite delay between requests; none is owed after the last one
+        if i:
+            time.sleep(random.uniform(2, 5))
         try:
-            req = Request(url, headers=headers)
-            with urlopen(req, timeout=30) as resp:
-                html = resp.read().decode("utf-8", errors="replace")
-
+            entry = dict(validators.get(url, {}))
+            body = _fetch(url, timeout=30, validators=entry)
+            if body is None:
+                _log(f"  Scamwatch/{category}: not modified")
+                continue
+            # Dropped again below if the page fails to process
+            if entry:
+                validators[url] = entry
+            else:
+                validators.pop(url, None)
+            html = body.decode("utf-8", errors="replace")
+
+            # Fresh per page: construction is ~0.5 us next to a ~10 ms parse
             parser = ScamPageParser()
             parser.feed(html)
             raw_text = parser.get_text()
@@ -167,7 +414,7 @@ def fetch_scamwatch(seen_hashes: set) -> int:
                 continue
 
             # Deduplicate by content hash
-            content_hash = hashlib.sha256(clean_text[:2000].encode()).hexdigest()[:16]
+            content_hash = _fingerprint(clean_text[:2000].encode())
             if content_hash in seen_hashes:
                 continue
             seen_hashes.add(content_hash)
@@ -182,34 +429,33 @@ def fetch_scamwatch(seen_hashes: set) -> int:
                 "fetched_at": datetime.now(timezone.utc).isoformat(),
             }
 
-            filename = f"scam_scamwatch_{ts}_{content_hash}.json"
-            (DATA_DIR / filename).write_text(json.dumps(record, indent=2))
+            filename = f"scam_scamwatch_{ts}_{content_hash:016x}.json"
+            (DATA_DIR / filename).write_bytes(_json_dumps(record))
             new_count += 1
             _log(f"  Scamwatch/{category}: {len(examples)} examples")
 
         except (HTTPError, URLError, TimeoutError) as e:
             _log(f"  Scamwatch/{category}: fetch failed — {e}")
         except Exception as e:
+            validators.pop(url, None)
             _log(f"  Scamwatch/{category}: parse error — {e}")
 
-        # Polite delay between pages
-        time.sleep(random.uniform(2, 5))
-
+    if validators != before:
+        tmp = PAGE_VALIDATORS.with_suffix(".tmp")
+        tmp.write_bytes(_json_dumps(validators))
+        os.replace(tmp, PAGE_VALIDATORS)
     return new_count
 
 
 def fetch_phishtank(seen_hashes: set) -> int:
     """Fetch verified phishing URLs from PhishTank public feed. Returns new record count."""
-    headers = {"User-Agent": USER_AGENT}
     try:
-        req = Request(PHISHTANK_FEED, headers=headers)
-        with urlopen(req, timeout=60) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
+        raw = _fetch(PHISHTANK_FEED, timeout=60)
     except (HTTPError, URLError, TimeoutError) as e:
         _log(f"  PhishTank: fetch failed — {e}")
         return 0
 
-    lines = raw.strip().split("\n")
+    lines = list(islice(_feed_lines(raw), 201))
     if len(lines) < 2:
         _log("  PhishTank: empty feed")
         return 0
@@ -217,28 +463,30 @@ def fetch_phishtank(seen_hashes: set) -> int:
     # CSV header: phish_id,url,phish_detail_url,submission_time,verified,verified_time,online,target
     new_count = 0
     entries = []
-    for line in lines[1:201]:  # Cap at 200 entries per fetch
-        parts = line.split(",")
-        if len(parts) < 8:
-            continue
-        phish_id = parts[0].strip('"')
-        url = parts[1].strip('"')
-        target = parts[7].strip('"') if len(parts) > 7 else "unknown"
-        verified = parts[4].strip('"').lower() == "yes"
-
-        if not verified:
-            continue
-
-        content_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
-        if content_hash in seen_hashes:
-            continue
-        seen_hashes.add(content_hash)
-        entries.append({
-            "phish_id": phish_id,
-            "url": suspicious_scan(url),
-            "target": target,
-            "verified": True,
-        })
+    try:
+        for parts in csv.reader(lines[1:]):  # Cap at 200 entries per fetch
+            if len(parts) < 8:
+                continue
+            phish_id = parts[0]
+            url = parts[1]
+            target = parts[7]
+            verified = parts[4].lower() == "yes"
+
+            if not verified:
+                continue
+
+            content_hash = _fingerprint(url.encode())
+            if content_hash in seen_hashes:
+                continue
+            seen_hashes.add(content_hash)
+            entries.append({
+                "phish_id": phish_id,
+                "url": suspicious_scan(url),
+                "target": target,
+                "verified": True,
+            })
+    except csv.Error as e:
+        _log(f"  PhishTank: parse error — {e}")
 
     if entries:
         ts = int(time.time())
@@ -250,7 +498,7 @@ def fetch_phishtank(seen_hashes: set) -> int:
             "fetched_at": datetime.now(timezone.utc).isoformat(),
         }
         filename = f"scam_phishtank_{ts}_{batch_hash}.json"
-        (DATA_DIR / filename).write_text(json.dumps(record, indent=2))
+        (DATA_DIR / filename).write_bytes(_json_dumps(record))
         new_count = len(entries)
         _log(f"  PhishTank: {new_count} verified phishing URLs")
 
@@ -259,23 +507,20 @@ def fetch_phishtank(seen_hashes: set) -> int:
 
 def fetch_openphish(seen_hashes: set) -> int:
     """Fetch real-time phishing feed from OpenPhish. Returns new record count."""
-    headers = {"User-Agent": USER_AGENT}
     try:
-        req = Request(OPENPHISH_FEED, headers=headers)
-        with urlopen(req, timeout=30) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
+        raw = _fetch(OPENPHISH_FEED, timeout=30)
     except (HTTPError, URLError, TimeoutError) as e:
         _log(f"  OpenPhish: fetch failed — {e}")
         return 0
 
-    urls = [u.strip() for u in raw.strip().split("\n") if u.strip()]
+    urls = [u.strip() for u in _feed_lines(raw) if u.strip()]
     if not urls:
         _log("  OpenPhish: empty feed")
         return 0
 
     new_urls = []
     for url in urls[:200]:  # Cap at 200
-        content_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
+        content_hash = _fingerprint(url.encode())
         if content_hash not in seen_hashes:
             seen_hashes.add(content_hash)
             new_urls.append(suspicious_scan(url))
@@ -290,7 +535,7 @@ def fetch_openphish(seen_hashes: set) -> int:
             "fetched_at": datetime.now(timezone.utc).isoformat(),
         }
         filename = f"scam_openphish_{ts}_{batch_hash}.json"
-        (DATA_DIR / filename).write_text(json.dumps(record, indent=2))
+        (DATA_DIR / filename).write_bytes(_json_dumps(record))
         _log(f"  OpenPhish: {len(new_urls)} phishing URLs")
 
     return len(new_urls)
@@ -298,39 +543,37 @@ def fetch_openphish(seen_hashes: set) -> int:
 
 def fetch_urlhaus(seen_hashes: set) -> int:
     """Fetch recent malware/scam URLs from URLhaus (abuse.ch). Returns new record count."""
-    headers = {"User-Agent": USER_AGENT}
     try:
-        req = Request(URLHAUS_FEED, headers=headers)
-        with urlopen(req, timeout=60) as resp:
-            raw = resp.read().decode("utf-8", errors="replace")
+        raw = _fetch(URLHAUS_FEED, timeout=60)
     except (HTTPError, URLError, TimeoutError) as e:
         _log(f"  URLhaus: fetch failed — {e}")
         return 0
 
-    lines = raw.strip().split("\n")
     entries = []
-    for line in lines:
-        if line.startswith("#") or not line.strip():
-            continue
-        # CSV: id,dateadded,url,url_status,last_online,threat,tags,urlhaus_link,reporter
-        parts = line.split('","')
-        if len(parts) < 7:
-            continue
-        url = parts[2].strip('"') if len(parts) > 2 else ""
-        threat = parts[5].strip('"') if len(parts) > 5 else "unknown"
-        tags = parts[6].strip('"') if len(parts) > 6 else ""
-
-        content_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
-        if content_hash in seen_hashes:
-            continue
-        seen_hashes.add(content_hash)
-        entries.append({
-            "url": suspicious_scan(url),
-            "threat": threat,
-            "tags": tags,
-        })
-        if len(entries) >= 200:
-            break
+    rows = csv.reader(line for line in _feed_lines(raw)
+                      if line.strip() and not line.startswith("#"))
+    try:
+        for parts in rows:
+            # CSV: id,dateadded,url,url_status,last_online,threat,tags,urlhaus_link,reporter
+            if len(parts) < 7:
+                continue
+            url = parts[2]
+            threat = parts[5]
+            tags = parts[6]
+
+            content_hash = _fingerprint(url.encode())
+            if content_hash in seen_hashes:
+                continue
+            seen_hashes.add(content_hash)
+            entries.append({
+                "url": suspicious_scan(url),
+                "threat": threat,
+                "tags": tags,
+            })
+            if len(entries) >= 200:
+                break
+    except csv.Error as e:
+        _log(f"  URLhaus: parse error — {e}")
 
     if entries:
         ts = int(time.time())
@@ -342,7 +585,7 @@ def fetch_urlhaus(seen_hashes: set) -> int:
             "fetched_at": datetime.now(timezone.utc).isoformat(),
         }
         filename = f"scam_urlhaus_{ts}_{batch_hash}.json"
-        (DATA_DIR / filename).write_text(json.dumps(record, indent=2))
+        (DATA_DIR / filename).write_bytes(_json_dumps(record))
         _log(f"  URLhaus: {len(entries)} malware/scam URLs")
 
     return len(entries)
@@ -354,38 +597,91 @@ def run_cycle(seen_hashes: set, cycle: int) -> int:
     _log(f"=== Public Scam Bridge — Cycle {cycle} ===")
     total = 0
 
-    # Scamwatch: rotate 2 pages per cycle (polite to gov site)
-    start_idx = (cycle * 2) % len(SCAMWATCH_PAGES)
-    pages_this_cycle = SCAMWATCH_PAGES[start_idx:start_idx + 2]
-    if not pages_this_cycle:
-        pages_this_cycle = SCAMWATCH_PAGES[:2]
-
-    _log("Fetching Scamwatch...")
-    # Temporarily override the global list for this cycle
-    original = list(SCAMWATCH_PAGES)
-    SCAMWATCH_PAGES.clear()
-    SCAMWATCH_PAGES.extend(pages_this_cycle)
-    total += fetch_scamwatch(seen_hashes)
-    SCAMWATCH_PAGES.clear()
-    SCAMWATCH_PAGES.extend(original)
-
-    # PhishTank + OpenPhish: alternate each cycle (both update frequently)
-    if cycle % 2 == 0:
-        _log("Fetching PhishTank...")
-        total += fetch_phishtank(seen_hashes)
-    else:
-        _log("Fetching OpenPhish...")
-        total += fetch_openphish(seen_hashes)
-
-    # URLhaus: every 3rd cycle
+    # The feeds download in the background while Scamwatch is paced through;
+    # parsing and dedupe still run below in source order.
+    feeds = [(PHISHTANK_FEED, 60) if cycle % 2 == 0 else (OPENPHISH_FEED, 30)]
     if cycle % 3 == 0:
-        _log("Fetching URLhaus...")
-        total += fetch_urlhaus(seen_hashes)
+        feeds.append((URLHAUS_FEED, 60))
+    pool = ThreadPoolExecutor(max_workers=len(feeds))
+    for url, timeout in feeds:
+        _PREFETCHED[url] = pool.submit(_http_get, url, timeout)
+
+    try:
+        # Scamwatch: rotate 2 pages per cycle (polite to gov site)
+        start_idx = (cycle * 2) % len(SCAMWATCH_PAGES)
+        pages_this_cycle = SCAMWATCH_PAGES[start_idx:start_idx + 2]
+        if not pages_this_cycle:
+            pages_this_cycle = SCAMWATCH_PAGES[:2]
+
+        _log("Fetching Scamwatch...")
+        total += fetch_scamwatch(seen_hashes, pages_this_cycle)
+
+        # PhishTank + OpenPhish: alternate each cycle (both update frequently)
+        if cycle % 2 == 0:
+            _log("Fetching PhishTank...")
+            total += fetch_phishtank(seen_hashes)
+        else:
+            _log("Fetching OpenPhish...")
+            total += fetch_openphish(seen_hashes)
+
+        # URLhaus: every 3rd cycle
+        if cycle % 3 == 0:
+            _log("Fetching URLhaus...")
+            total += fetch_urlhaus(seen_hashes)
+    finally:
+        pool.shutdown()
+        _PREFETCHED.clear()
+        close_connections()
 
     _log(f"Cycle {cycle} complete: {total} new records")
     return total
 
 
+# ==================== SEEN HASHES ====================
+def load_seen() -> tuple[set, int]:
+    """Read the seen log. Returns (fingerprints, number of log lines)."""
+    try:
+        data = SEEN_LOG.read_bytes()
+    except FileNotFoundError:
+        seen = set()
+        if SEEN_LEGACY.exists():
+            try:
+                # Older files hold the keys as 16-char hex strings
+                seen = {int(h, 16) if isinstance(h, str) else h
+                        for h in _json_loads(SEEN_LEGACY.read_bytes())}
+            except (json.JSONDecodeError, TypeError, ValueError):
+                pass
+        append_seen(seen)
+        return seen, len(seen)
+
+    lines = data.split(b"\n")
+    torn = lines.pop()  # b"" unless the last append was cut short
+    seen = set()
+    for line in lines:
+        try:
+            seen.add(int(line))
+        except ValueError:
+            pass
+    if torn:
+        return seen, compact_seen()
+    return seen, len(lines)
+
+
+def append_seen(fingerprints) -> None:
+    """Append new fingerprints to the seen log."""
+    with open(SEEN_LOG, "ab") as f:
+        f.write(b"".join(b"%d\n" % fp for fp in fingerprints))
+
+
+def compact_seen() -> int:
+    """Rewrite the seen log keeping its newest SEEN_CAP lines. Returns the line count."""
+    lines = SEEN_LOG.read_bytes().split(b"\n")[:-1][-SEEN_CAP:]
+    tmp = SEEN_LOG.with_suffix(".tmp")
+    tmp.write_bytes(b"".join(line + b"\n" for line in lines))
+    os.replace(tmp, SEEN_LOG)
+    return len(lines)
+
+
 # ==================== MAIN LOOP ====================
 def main():
     if len(sys.argv) > 1 and sys.argv[1] == "kill":
@@ -400,13 +696,20 @@ def main():
     _log("  100% on-device. Ghost gloves on. Your device. Your rules.")
 
     # Load seen hashes to avoid re-fetching
-    seen_file = DATA_DIR.parent / "scam_seen.json"
-    seen_hashes = set()
-    if seen_file.exists():
-        try:
-            seen_hashes = set(json.loads(seen_file.read_text()))
-        except (json.JSONDecodeError, TypeError):
-            pass
+    seen_hashes, seen_lines = load_seen()
+    persisted = set(seen_hashes)
+
+    def persist_seen():
+        """Log fingerprints added since the last call; compact past 2x the cap."""
+        nonlocal seen_lines
+        new = seen_hashes - persisted
+        if not new:
+            return
+        append_seen(new)
+        persisted.update(new)
+        seen_lines += len(new)
+        if seen_lines > 2 * SEEN_CAP:
+            seen_lines = compact_seen()
 
     cycle = 0
     while True:
@@ -414,7 +717,7 @@ def main():
             total = run_cycle(seen_hashes, cycle)
 
             # Persist seen hashes
-            seen_file.write_text(json.dumps(list(seen_hashes)[-10000:]))  # Cap at 10K
+            persist_seen()
 
             if once:
                 _log(f"Single cycle done. {total} new records.")
@@ -427,7 +730,7 @@ def main():
 
         except KeyboardInterrupt:
             _log("Interrupted — shutting down cleanly.")
-            seen_file.write_text(json.dumps(list(seen_hashes)[-10000:]))
+            persist_seen()
             break
         except Exception as e:
             _log(f"Cycle error: {e}")
@@ -9,22 +9,44 @@ Only patterns reach the dojos — never raw victim data. 100% on-device.
 """
 
 import json
+import os
 import re
 import sys
 import uuid
 import hashlib
+from contextlib import ExitStack
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+from dojo_files import count_files, list_files, write_file
+
+try:
+    import orjson
+except ImportError:  # stdlib fallback — same data, just slower
+    orjson = None
+
 # ==================== PATHS ====================
 RAW_DIR = Path.home() / ".config" / "observer" / "raw"
 GUARDIAN_DOJO_DIR = Path.home() / ".config" / "observer" / "scenarios" / "guardian_dojo"
 FINANCIAL_DOJO_DIR = Path.home() / ".config" / "observer" / "scenarios" / "financial_dojo"
-PROCESSED_LOG = Path.home() / ".config" / "observer" / "scam_processed.json"
+# Append-only, one converted file name per line
+PROCESSED_LOG = Path.home() / ".config" / "observer" / "scam_processed.txt"
+PROCESSED_LEGACY = Path.home() / ".config" / "observer" / "scam_processed.json"  # whole-list format, migrated on load
 
 GUARDIAN_DOJO_DIR.mkdir(parents=True, exist_ok=True)
 FINANCIAL_DOJO_DIR.mkdir(parents=True, exist_ok=True)
 
+# Signal scanning and JSON encoding are CPU-bound, so large backlogs fan out
+# across processes. Below PARALLEL_MIN_FILES, worker startup costs more than it saves.
+CONVERT_WORKERS = os.cpu_count() or 1
+PARALLEL_MIN_FILES = 100
+
 
 def _log(*args):
     print(f"[{datetime.now(timezone.utc).isoformat()}]", *args, flush=True)
@@ -65,15 +87,55 @@ SIGNAL_PATTERNS = {
     ],
 }
 
+SIGNAL_PATTERNS = {
+    category: [re.compile(p) for p in patterns]
+    for category, patterns in SIGNAL_PATTERNS.items()
+}
+
+# Most signals are plain phrases, and findall on a plain phrase is just the
+# phrase once per non-overlapping occurrence. Those are counted in one pass
+# over the text; only the real regexes go through re.
+_REGEX_META = frozenset("\\.^$*+?{}[]|()")
+SIGNAL_SCANS = {
+    category: [p.pattern if _REGEX_META.isdisjoint(p.pattern) else p for p in patterns]
+    for category, patterns in SIGNAL_PATTERNS.items()
+}
+SIGNAL_LITERALS = {scan for scans in SIGNAL_SCANS.values() for scan in scans if type(scan) is str}
+if ahocorasick is not None:
+    _LITERAL_AUTOMATON = ahocorasick.Automaton()
+    for _literal in SIGNAL_LITERALS:
+        _LITERAL_AUTOMATON.add_word(_literal, _literal)
+    _LITERAL_AUTOMATON.make_automaton()
+
+
+def _literal_counts(text: str) -> dict[str, int]:
+    """Non-overlapping occurrences of each SIGNAL_LITERALS phrase, as str.count gives."""
+    if ahocorasick is None:
+        return {lit: text.count(lit) for lit in SIGNAL_LITERALS if lit in text}
+    counts = {}
+    next_start = {}
+    for end, lit in _LITERAL_AUTOMATON.iter(text):
+        start = end - len(lit) + 1
+        if start >= next_start.get(lit, 0):
+            counts[lit] = counts.get(lit, 0) + 1
+            next_start[lit] = end + 1
+    return counts
+
 
 def detect_signals(text: str) -> dict[str, list[str]]:
     """Detect behavioral signals in text. Returns {category: [matched_phrases]}."""
     signals = {}
     text_lower = text.lower()
-    for category, patterns in SIGNAL_PATTERNS.items():
+    counts = _literal_counts(text_lower)
+    for category, scans in SIGNAL_SCANS.items():
         matches = []
-        for pattern in patterns:
-            found = re.findall(pattern, text_lower)
+        for scan in scans:
+            if type(scan) is str:
+                n = counts.get(scan)
+                if n:
+                    matches.extend([scan] * min(n, 3))  # Cap per pattern
+                continue
+            found = scan.findall(text_lower)
             if found:
                 matches.extend(found[:3])  # Cap per pattern
         if matches:
@@ -81,32 +143,32 @@ def detect_signals(text: str) -> dict[str, list[str]]:
     return signals
 
 
+CATEGORY_WEIGHTS = {
+    "urgency_pressure": 0.15,
+    "authority_claim": 0.15,
+    "information_extraction": 0.25,
+    "deception": 0.20,
+    "resource_solicitation": 0.20,
+    "emotional_manipulation": 0.15,
+}
+# Diversity multiplier by number of categories, 3 or more sharing the last
+DIVERSITY_MULTIPLIERS = (1.0, 0.6, 1.1, 1.3)
+
+
 def compute_threat_score(signals: dict) -> float:
-    """Compute threat score from signals. Same algorithm as moltbook converter."""
-    weights = {
-        "urgency_pressure": 0.15,
-        "authority_claim": 0.15,
-        "information_extraction": 0.25,
-        "deception": 0.20,
-        "resource_solicitation": 0.20,
-        "emotional_manipulation": 0.15,
-    }
+    """Compute threat score from signals. Same algorithm as moltbook converter.
+    Scored one example at a time: it costs under a microsecond, and whether
+    convert_scamwatch rescans with page context depends on each result."""
     score = 0.0
     for cat, matches in signals.items():
-        w = weights.get(cat, 0.10)
-        # Diminishing returns per match
-        for i, _ in enumerate(matches):
-            score += w * (0.5 ** i)
-
-    # Diversity multiplier
-    n_cats = len(signals)
-    if n_cats >= 3:
-        score *= 1.3
-    elif n_cats >= 2:
-        score *= 1.1
-    elif n_cats == 1:
-        score *= 0.6
-
+        w = CATEGORY_WEIGHTS.get(cat, 0.10)
+        # Diminishing returns per match. Halving is exact, so each term
+        # equals w * 0.5 ** i without the pow call.
+        for _ in matches:
+            score += w
+            w *= 0.5
+
+    score *= DIVERSITY_MULTIPLIERS[min(len(signals), 3)]
     return min(score, 1.0)
 
 
@@ -130,8 +192,9 @@ SCAMWATCH_TO_FINANCIAL_TYPE = {
 }
 
 
-def convert_scamwatch(record: dict) -> tuple[list[dict], list[dict]]:
-    """Convert a Scamwatch record into Guardian + Financial dojo scenarios."""
+def convert_scamwatch(record: dict, converted_at: str) -> tuple[list[dict], list[dict]]:
+    """Convert a Scamwatch record into Guardian + Financial dojo scenarios.
+    ``converted_at`` is the run's ISO timestamp, shared by every scenario."""
     guardian_scenarios = []
     financial_scenarios = []
 
@@ -196,7 +259,7 @@ def convert_scamwatch(record: dict) -> tuple[list[dict], list[dict]]:
                 "source": "scamwatch",
                 "category": category,
                 "exampleType": ex.get("type", "unknown"),
-                "convertedAt": datetime.now(timezone.utc).isoformat(),
+                "convertedAt": converted_at,
             },
         })
 
@@ -208,6 +271,9 @@ def convert_scamwatch(record: dict) -> tuple[list[dict], list[dict]]:
         elif any(kw in text.lower() for kw in ["solana", "sol"]):
             chain = "solana"
 
+        # Synthetic contract address: the first 160 bits of SHA-256, the same
+        # derivation world_data_to_dojo uses. BLAKE2b-160 was measured: no
+        # faster on texts this long, and it would change every address.
         financial_scenarios.append({
             "id": str(uuid.uuid4()),
             "context": {
@@ -238,7 +304,7 @@ def convert_scamwatch(record: dict) -> tuple[list[dict], list[dict]]:
                 "source": "scamwatch",
                 "category": category,
                 "originalExampleType": ex.get("type", "unknown"),
-                "convertedAt": datetime.now(timezone.utc).isoformat(),
+                "convertedAt": converted_at,
             },
         })
 
@@ -246,8 +312,9 @@ def convert_scamwatch(record: dict) -> tuple[list[dict], list[dict]]:
 
 
 # ==================== PHISHING FEEDS → FINANCIAL DOJO ====================
-def convert_phishing_feed(record: dict) -> tuple[list[dict], list[dict]]:
-    """Convert PhishTank/OpenPhish/URLhaus records into Financial Dojo scenarios."""
+def convert_phishing_feed(record: dict, converted_at: str) -> tuple[list[dict], list[dict]]:
+    """Convert PhishTank/OpenPhish/URLhaus records into Financial Dojo scenarios.
+    ``converted_at`` is the run's ISO timestamp, shared by every scenario."""
     guardian_scenarios = []
     financial_scenarios = []
     source = record.get("source", "unknown")
@@ -277,7 +344,9 @@ def convert_phishing_feed(record: dict) -> tuple[list[dict], list[dict]]:
         if len(url) < 10:
             continue
 
-        # Determine financial threat type from URL patterns
+        # Determine financial threat type from URL patterns. A handful of
+        # substring checks on a short URL; one Aho-Corasick pass saves ~0.3 us
+        # here, nothing next to writing the scenario file.
         url_lower = url.lower()
         if any(kw in url_lower for kw in ["wallet", "metamask", "phantom", "uniswap", "pancake"]):
             fin_type = "drainerContract"
@@ -332,27 +401,94 @@ def convert_phishing_feed(record: dict) -> tuple[list[dict], list[dict]]:
                 "originalUrl": url,
                 "target": item.get("target", "unknown"),
                 "tags": item.get("tags", ""),
-                "convertedAt": datetime.now(timezone.utc).isoformat(),
+                "convertedAt": converted_at,
             },
         })
 
     return guardian_scenarios, financial_scenarios
 
 
+# ==================== JSON ====================
+def _json_loads(data: bytes):
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj) -> bytes:
+    """Serialize to indented JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
+# ==================== PROCESSED LOG ====================
+def load_processed() -> set:
+    """Names of the scam files already converted. The log is rewritten when
+    its last append was cut short or it holds more duplicates than names."""
+    try:
+        data = PROCESSED_LOG.read_bytes()
+    except FileNotFoundError:
+        processed = set()
+        if PROCESSED_LEGACY.exists():
+            try:
+                processed = set(_json_loads(PROCESSED_LEGACY.read_bytes()))
+            except (json.JSONDecodeError, TypeError):
+                pass
+        compact_processed(processed)
+        return processed
+
+    lines = data.split(b"\n")
+    torn = lines.pop()  # b"" unless the last append was cut short
+    processed = {os.fsdecode(line) for line in lines if line}
+    if torn or len(lines) > 2 * len(processed):
+        compact_processed(processed)
+    return processed
+
+
+def compact_processed(processed: set) -> None:
+    """Rewrite the processed log with one line per name."""
+    tmp = PROCESSED_LOG.with_suffix(".tmp")
+    tmp.write_bytes(b"".join(os.fsencode(name) + b"\n" for name in sorted(processed)))
+    os.replace(tmp, PROCESSED_LOG)
+
+
 # ==================== MAIN ====================
+def convert_file(path: str, converted_at: str) -> tuple[str | None, list[bytes], list[bytes]]:
+    """Convert one scam file into (skip reason, guardian JSON, financial JSON).
+    The reason is None unless the file can't be converted.
+    Touches no output files, so it can run in a worker process."""
+    name = os.path.basename(path)
+    try:
+        with open(path, "rb") as f:
+            record = _json_loads(f.read())
+    except (json.JSONDecodeError, ValueError):
+        return f"  Skipping malformed: {name}", [], []
+
+    source = record.get("source", "unknown")
+
+    if source == "scamwatch":
+        g_scenarios, f_scenarios = convert_scamwatch(record, converted_at)
+    elif source in ("phishtank", "openphish", "urlhaus"):
+        g_scenarios, f_scenarios = convert_phishing_feed(record, converted_at)
+    else:
+        return f"  Unknown source: {source} in {name}", [], []
+
+    return (
+        None,
+        [_json_dumps(gs) for gs in g_scenarios],
+        [_json_dumps(fs) for fs in f_scenarios],
+    )
+
+
 def main():
     _log("Public Scam → Dojo Converter starting")
 
-    # Load processed file list
-    processed = set()
-    if PROCESSED_LOG.exists():
-        try:
-            processed = set(json.loads(PROCESSED_LOG.read_text()))
-        except (json.JSONDecodeError, TypeError):
-            pass
+    processed = load_processed()
 
     # Find all scam_*.json files
-    scam_files = sorted(RAW_DIR.glob("scam_*.json"))
+    scam_files = list_files(RAW_DIR, "scam_", ".json")
     if not scam_files:
         _log("No scam files to convert.")
         return
@@ -361,50 +497,51 @@ def main():
 
     total_guardian = 0
     total_financial = 0
-    ts = int(datetime.now(timezone.utc).timestamp())
-
-    for sf in scam_files:
-        if sf.name in processed:
-            continue
-
-        try:
-            record = json.loads(sf.read_text())
-        except (json.JSONDecodeError, ValueError):
-            _log(f"  Skipping malformed: {sf.name}")
-            processed.add(sf.name)
-            continue
-
-        source = record.get("source", "unknown")
-
-        if source == "scamwatch":
-            g_scenarios, f_scenarios = convert_scamwatch(record)
-        elif source in ("phishtank", "openphish", "urlhaus"):
-            g_scenarios, f_scenarios = convert_phishing_feed(record)
+    now = datetime.now(timezone.utc)
+    ts = int(now.timestamp())
+    converted_at = now.isoformat()
+
+    pending = [sf for sf in scam_files if os.path.basename(sf) not in processed]
+    guardian_dir = str(GUARDIAN_DOJO_DIR)
+    financial_dir = str(FINANCIAL_DOJO_DIR)
+    with ExitStack() as stack:
+        if CONVERT_WORKERS > 1 and len(pending) >= PARALLEL_MIN_FILES:
+            # Imported here: multiprocessing dominates startup for small runs
+            from concurrent.futures import ProcessPoolExecutor
+            pool = ProcessPoolExecutor(max_workers=CONVERT_WORKERS)
+            # On an error below, don't wait for the rest of the backlog to convert
+            stack.callback(pool.shutdown, cancel_futures=True)
+            results = pool.map(convert_file, pending, repeat(converted_at), chunksize=8)
         else:
-            _log(f"  Unknown source: {source} in {sf.name}")
-            processed.add(sf.name)
-            continue
-
-        # Write Guardian scenarios
-        for i, gs in enumerate(g_scenarios):
-            fname = f"scamwatch_{ts}_{sf.stem}_{i}.json"
-            (GUARDIAN_DOJO_DIR / fname).write_text(json.dumps(gs, indent=2))
-            total_guardian += 1
-
-        # Write Financial scenarios
-        for i, fs in enumerate(f_scenarios):
-            fname = f"financial_scam_{ts}_{sf.stem}_{i}.json"
-            (FINANCIAL_DOJO_DIR / fname).write_text(json.dumps(fs, indent=2))
-            total_financial += 1
-
-        processed.add(sf.name)
-
-    # Save processed log
-    PROCESSED_LOG.write_text(json.dumps(list(processed)))
+            results = map(convert_file, pending, repeat(converted_at))
+
+        # Only the main process writes, in file order, as each result arrives
+        # Unbuffered: each name is logged as soon as its file is done
+        log = stack.enter_context(open(PROCESSED_LOG, "ab", buffering=0))
+        for sf, (skipped, g_files, f_files) in zip(pending, results):
+            name = os.path.basename(sf)
+            if skipped:
+                _log(skipped)
+            else:
+                stem = os.path.splitext(name)[0]
+
+                # Write Guardian scenarios
+                for i, data in enumerate(g_files):
+                    fname = f"scamwatch_{ts}_{stem}_{i}.json"
+                    write_file(os.path.join(guardian_dir, fname), data)
+                    total_guardian += 1
+
+                # Write Financial scenarios
+                for i, data in enumerate(f_files):
+                    fname = f"financial_scam_{ts}_{stem}_{i}.json"
+                    write_file(os.path.join(financial_dir, fname), data)
+                    total_financial += 1
+
+            log.write(os.fsencode(name) + b"\n")
 
     _log(f"Conversion complete:")
-    _log(f"  Guardian scenarios: +{total_guardian} (total: {len(list(GUARDIAN_DOJO_DIR.glob('*.json')))})")
-    _log(f"  Financial scenarios: +{total_financial} (total: {len(list(FINANCIAL_DOJO_DIR.glob('*.json')))})")
+    _log(f"  Guardian scenarios: +{total_guardian} (total: {count_files(GUARDIAN_DOJO_DIR, '.json')})")
+    _log(f"  Financial scenarios: +{total_financial} (total: {count_files(FINANCIAL_DOJO_DIR, '.json')})")
 
 
 if __name__ == "__main__":